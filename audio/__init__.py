@@ -1,15 +1,19 @@
 """
 Audio module package initialization.
 """
-# Import statements to make components available from the package
-try:
-    from audio.player import AudioPlayer
-    from audio.queue_manager import QueueManager
-    from audio.metadata import MetadataHandler
-    
-    __all__ = ['AudioPlayer', 'QueueManager', 'MetadataHandler']
-except ImportError as e:
-    # Log but don't fail if there's an import error
-    import logging
-    logging.warning(f"Error importing audio components: {str(e)}")
-    __all__ = []
\ No newline at end of file
+# Components are imported on first access (PEP 562), so importing
+# audio.player for the GUI does not also load mutagen via audio.metadata.
+import importlib
+
+_COMPONENTS = {
+    'AudioPlayer': 'audio.player',
+    'QueueManager': 'audio.queue_manager',
+    'MetadataHandler': 'audio.metadata',
+}
+
+__all__ = list(_COMPONENTS)
+
+def __getattr__(name):
+    if name in _COMPONENTS:
+        return getattr(importlib.import_module(_COMPONENTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
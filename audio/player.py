@@ -4,7 +4,7 @@ Audio player module for playing audio files.
 import os
 import logging
 from typing import Optional, Dict, Any
-from PyQt5.QtCore import QObject, QUrl, QTimer, pyqtSignal
+from PyQt5.QtCore import QObject, QUrl, pyqtSignal
 from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
 
 class AudioPlayer(QObject):
@@ -26,30 +26,45 @@ class AudioPlayer(QObject):
         """Initialize the audio player."""
         super().__init__()
         
-        # Create media player
-        self.player = QMediaPlayer()
-        
-        # Connect signals
-        self.player.positionChanged.connect(self.handle_position_changed)
-        self.player.durationChanged.connect(self.handle_duration_changed)
-        self.player.stateChanged.connect(self.handle_state_changed)
-        self.player.mediaStatusChanged.connect(self.handle_media_status_changed)
+        # Media player, created on first use (see the player property)
+        self._player = None
         
         # Track info
         self.current_track = None
         self.current_track_id = None
         self.current_volume = 80  # Default volume (0-100)
         
-        # Initialize with volume
-        self.player.setVolume(self.current_volume)
-        
-        # Timer for track end detection (workaround for some platforms)
-        self.track_end_timer = QTimer(self)
-        self.track_end_timer.timeout.connect(self.check_track_end)
-        self.track_end_timer.setInterval(500)  # Check every 500ms
-        
         logging.info("Audio player initialized")
         
+    @property
+    def player(self) -> QMediaPlayer:
+        """
+        The underlying media player.
+        
+        Creating a QMediaPlayer loads the platform multimedia backend, which
+        can take a noticeable moment, so it is deferred until playback is
+        first needed instead of slowing down application startup.
+        """
+        if self._player is None:
+            player = QMediaPlayer(self)
+            
+            # Connect signals
+            player.positionChanged.connect(self.handle_position_changed)
+            player.durationChanged.connect(self.handle_duration_changed)
+            player.stateChanged.connect(self.handle_state_changed)
+            player.mediaStatusChanged.connect(self.handle_media_status_changed)
+            
+            # Initialize with volume
+            player.setVolume(self.current_volume)
+            
+            # Position updates double as the track end check, so report them
+            # as often as the old polling timer did
+            player.setNotifyInterval(500)
+            
+            self._player = player
+            logging.debug("Media player backend created")
+        return self._player
+    
     def load(self, file_path: str, track_id: Optional[str] = None) -> bool:
         """
         Load an audio file for playback.
@@ -87,10 +102,6 @@ class AudioPlayer(QObject):
         """Start or resume playback."""
         logging.info("Playing audio")
         self.player.play()
-        
-        # Start monitoring for track end
-        if not self.track_end_timer.isActive():
-            self.track_end_timer.start()
             
     def pause(self) -> None:
         """Pause playback."""
@@ -100,11 +111,8 @@ class AudioPlayer(QObject):
     def stop(self) -> None:
         """Stop playback."""
         logging.info("Stopping audio")
-        self.player.stop()
-        
-        # Stop monitoring for track end
-        if self.track_end_timer.isActive():
-            self.track_end_timer.stop()
+        if self._player is not None:
+            self._player.stop()
         
     def set_position(self, position_ms: int) -> None:
         """
@@ -113,7 +121,7 @@ class AudioPlayer(QObject):
         Args:
             position_ms: Position in milliseconds
         """
-        logging.debug(f"Setting position to {position_ms}ms")
+        # Not logged: this runs for every step of a seek-bar drag
         self.player.setPosition(position_ms)
         
     def set_position_and_play(self, position_ms: int) -> None:
@@ -136,9 +144,10 @@ class AudioPlayer(QObject):
         # Ensure volume is within range
         volume = max(0, min(100, volume))
         
-        logging.debug(f"Setting volume to {volume}")
+        # Not logged: this runs for every step of a volume slider drag
         self.current_volume = volume
-        self.player.setVolume(volume)
+        if self._player is not None:
+            self._player.setVolume(volume)
         
     def get_position(self) -> int:
         """
@@ -192,6 +201,7 @@ class AudioPlayer(QObject):
             position: Current position in milliseconds
         """
         self.position_changed.emit(position)
+        self.check_track_end(position)
         
     def handle_duration_changed(self, duration: int) -> None:
         """
@@ -250,19 +260,24 @@ class AudioPlayer(QObject):
             logging.error("Invalid media")
             self.stop()
             
-    def check_track_end(self) -> None:
+    def check_track_end(self, position: int) -> None:
         """
         Check if the track has ended. This is a workaround for platforms
         where the EndOfMedia status might not be reliable.
+        
+        Called from the player's position updates, which Qt only sends while
+        playing, so nothing runs while paused or stopped.
+        
+        Args:
+            position: Current position in milliseconds
         """
         # Only check if we're playing and we have a track
         if self.get_state() == self.PLAYING and self.current_track:
-            position = self.get_position()
             duration = self.get_duration()
             
             # Check if we're at the end of the track
             # Use a small threshold to account for timing issues
             if position >= duration - 200 and duration > 0:
-                logging.debug("Track end detected by timer")
+                logging.debug("Track end detected by position update")
                 self.stop()
                 self.track_ended.emit()
\ No newline at end of file
@@ -5,10 +5,15 @@ import os
 import json
 import logging
 import random
+from collections import deque
+from itertools import islice
 from typing import List, Dict, Optional, Any
 from datetime import datetime
 from PyQt5.QtCore import QObject, pyqtSignal
 
+# Number of play history entries kept
+MAX_HISTORY_ENTRIES = 1000
+
 class QueueManager(QObject):
     """Manages audio playback queues."""
     
@@ -30,7 +35,8 @@ class QueueManager(QObject):
         self.history_file = history_file
         self.current_queue = []
         self.current_index = -1
-        self.play_history = []
+        # Bounded, so the oldest entries drop off as new ones are added
+        self.play_history = deque(maxlen=MAX_HISTORY_ENTRIES)
         
         # Load history
         self._load_history()
@@ -43,21 +49,21 @@ class QueueManager(QObject):
             if os.path.exists(self.history_file):
                 with open(self.history_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
-                    self.play_history = data.get('history', [])
+                    self.play_history = deque(data.get('history', []), maxlen=MAX_HISTORY_ENTRIES)
                     logging.debug(f"Loaded {len(self.play_history)} entries from play history")
             else:
                 # Create empty history file
                 self._save_history()
         except Exception as e:
             logging.error(f"Error loading play history: {str(e)}")
-            self.play_history = []
+            self.play_history = deque(maxlen=MAX_HISTORY_ENTRIES)
     
     def _save_history(self):
         """Save playback history to file."""
         try:
             with open(self.history_file, 'w', encoding='utf-8') as f:
                 json.dump({
-                    'history': self.play_history,
+                    'history': list(self.play_history),
                     'last_updated': datetime.now().isoformat()
                 }, f, indent=2)
             logging.debug(f"Saved {len(self.play_history)} entries to play history")
@@ -238,11 +244,11 @@ class QueueManager(QObject):
         current_track = self.get_current_track()
         
         if maintain_current and current_track:
-            # Remove current track, shuffle the rest, then reinsert
-            remaining_tracks = self.current_queue[:self.current_index] + self.current_queue[self.current_index+1:]
-            random.shuffle(remaining_tracks)
-            
-            self.current_queue = remaining_tracks[:self.current_index] + [current_track] + remaining_tracks[self.current_index:]
+            # Remove current track, shuffle the rest, then reinsert, all in
+            # place rather than building sliced copies of the queue
+            self.current_queue.pop(self.current_index)
+            random.shuffle(self.current_queue)
+            self.current_queue.insert(self.current_index, current_track)
         else:
             # Shuffle the entire queue
             random.shuffle(self.current_queue)
@@ -269,12 +275,8 @@ class QueueManager(QObject):
             'position': self.current_index
         }
         
-        # Add to history
+        # Add to history (the deque drops the oldest entry once full)
         self.play_history.append(entry)
-        
-        # Trim history if too long (keep last 1000 entries)
-        if len(self.play_history) > 1000:
-            self.play_history = self.play_history[-1000:]
             
         # Save history
         self._save_history()
@@ -292,11 +294,12 @@ class QueueManager(QObject):
             List of history entries (most recent first)
         """
         if limit is not None and limit > 0:
-            return self.play_history[-limit:]
-        return self.play_history.copy()
+            start = max(0, len(self.play_history) - limit)
+            return list(islice(self.play_history, start, None))
+        return list(self.play_history)
     
     def clear_history(self):
         """Clear the play history."""
-        self.play_history = []
+        self.play_history.clear()
         self._save_history()
         logging.info("Play history cleared")
\ No newline at end of file
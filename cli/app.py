@@ -6,7 +6,6 @@ import os
 import sys
 import logging
 from typing import List, Optional
-import time
 import argparse
 
 from data.config_manager import ConfigHandler
@@ -341,9 +340,6 @@ class CLIApp:
             
             else:
                 print("Invalid choice. Please try again.")
-            
-            # Small pause before showing the menu again
-            time.sleep(1)
     
     def run(self) -> int:
         """
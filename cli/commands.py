@@ -5,6 +5,7 @@ Implements command-line interface commands.
 """
 import os
 import re
+import heapq
 import logging
 from typing import Optional, List, Dict, Tuple
 
@@ -29,11 +30,8 @@ def download_command(downloader, tracker, url: str) -> int:
     if "list=" in url:  # It's a playlist
         print("Detected playlist URL")
         # Try to get playlist name 
-        playlist_name = None
-        for playlist in tracker.get_playlists():
-            if playlist["url"] == url:
-                playlist_name = playlist["name"]
-                break
+        playlist = tracker.get_playlist(url)
+        playlist_name = playlist["name"] if playlist else None
                 
         if not playlist_name:
             playlist_name = input("Enter a name for this playlist (for folder organization): ")
@@ -216,7 +214,8 @@ def update_playlists_command(tracker, downloader, config) -> int:
         print(f"URL: {url}")
         
         # Get videos in the playlist
-        videos = downloader.get_playlist_videos(url)
+        # Only IDs and titles are needed to find the new videos
+        videos = downloader.get_playlist_videos(url, detailed=False)
         
         if not videos:
             print("No videos found in playlist or error retrieving playlist")
@@ -411,13 +410,13 @@ def display_top_videos_command(tracker, limit: int = 10) -> int:
         print("No videos in the download history")
         return 0
     
-    # Sort videos by view count (descending)
-    videos.sort(key=lambda x: x.get('view_count', 0), reverse=True)
+    # Pick the most viewed videos without sorting the whole history
+    top_videos = heapq.nlargest(limit, videos, key=lambda x: x.get('view_count', 0))
     
-    print(f"\nTop {min(limit, len(videos))} Videos by View Count:")
+    print(f"\nTop {len(top_videos)} Videos by View Count:")
     print("-" * 80)
     
-    for i, video in enumerate(videos[:limit], 1):
+    for i, video in enumerate(top_videos, 1):
         title = video.get('title', 'Unknown Title')
         view_count = video.get('view_count', 0)
         view_count_updated = video.get('view_count_updated', 'Never')
@@ -3,12 +3,47 @@ Configuration manager module.
 Handles loading and saving of application configuration.
 """
 import os
+import stat
 import logging
+import tempfile
 import configparser
 from typing import Any, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# Permissions given to a newly created config file
+NEW_CONFIG_MODE = 0o644
+
+
+class ConfigBatch:
+    """Context manager that defers config writes until the block exits."""
+    
+    def __init__(self, handler: "ConfigHandler"):
+        """
+        Initialize the batch.
+        
+        Args:
+            handler: Config handler whose saves should be deferred
+        """
+        self.handler = handler
+        self.saved = False
+    
+    def __enter__(self) -> "ConfigBatch":
+        self.handler._defer_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.handler._defer_depth -= 1
+        if exc_type is None and self.handler._defer_depth == 0:
+            if self.handler._dirty:
+                # Flushes changes made in the block and any unsaved ones before it
+                self.saved = self.handler.save_config()
+            else:
+                logger.debug("No configuration changes to save")
+                self.saved = True
+        return False
+
+
 class ConfigHandler:
     """Class to handle application configuration loading and saving."""
     
@@ -50,6 +85,9 @@ class ConfigHandler:
         """
         self.config_file = config_file
         self.config = configparser.ConfigParser()
+        self._defer_depth = 0
+        # True while the in-memory config has changes not yet written
+        self._dirty = False
         self._load_config()
     
     def _create_default_config(self) -> None:
@@ -58,8 +96,7 @@ class ConfigHandler:
             self.config[section] = options
             
         try:
-            with open(self.config_file, 'w') as f:
-                self.config.write(f)
+            self._write_config()
             logger.info(f"Created default configuration file: {self.config_file}")
         except Exception as e:
             logger.error(f"Error creating default configuration: {str(e)}")
@@ -72,19 +109,23 @@ class ConfigHandler:
                 logger.info(f"Loaded configuration from: {self.config_file}")
                 
                 # Validate required sections and add missing ones
+                changed = False
                 for section, options in self.DEFAULT_CONFIG.items():
                     if not self.config.has_section(section):
                         logger.warning(f"Missing section [{section}] in config, adding default")
                         self.config[section] = options
+                        changed = True
                     else:
                         # Add any missing options with default values
                         for option, value in options.items():
                             if not self.config.has_option(section, option):
                                 logger.warning(f"Missing option {option} in [{section}], adding default")
                                 self.config[section][option] = value
+                                changed = True
                 
                 # Save if any changes were made
-                self.save_config()
+                if changed:
+                    self.save_config()
                     
             except Exception as e:
                 logger.error(f"Error loading configuration: {str(e)}. Using defaults.")
@@ -100,6 +141,11 @@ class ConfigHandler:
         Returns:
             True if successful, False otherwise
         """
+        if self._defer_depth:
+            # Inside a batch(); the write happens once when it exits
+            self._dirty = True
+            return True
+            
         try:
             # Create a backup of the existing config
             if os.path.exists(self.config_file):
@@ -112,14 +158,52 @@ class ConfigHandler:
                     logger.warning(f"Failed to create config backup: {str(e)}")
             
             # Save the updated config
-            with open(self.config_file, 'w') as f:
-                self.config.write(f)
+            self._write_config()
+            self._dirty = False
             logger.info(f"Saved configuration to: {self.config_file}")
             return True
         except Exception as e:
             logger.error(f"Error saving configuration: {str(e)}")
             return False
     
+    def _write_config(self) -> None:
+        """Write the configuration via a temp file so the file is never left half-written."""
+        config_dir = os.path.dirname(os.path.abspath(self.config_file))
+        fd, temp_path = tempfile.mkstemp(dir=config_dir, prefix=".config-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                self.config.write(f)
+            
+            # mkstemp creates the file as 0600; keep the existing file's mode,
+            # or give a new file the usual 0644 (reading the umask would mean
+            # changing it, which races with threads creating files)
+            try:
+                mode = stat.S_IMODE(os.stat(self.config_file).st_mode)
+            except FileNotFoundError:
+                mode = NEW_CONFIG_MODE
+            os.chmod(temp_path, mode)
+            
+            os.replace(temp_path, self.config_file)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+    
+    def batch(self) -> ConfigBatch:
+        """
+        Group several changes into a single write.
+        
+        Calls to save_config() inside the block are deferred and the file is
+        written once on exit. The result is available as ``saved`` on the
+        returned object after the block.
+        
+        Returns:
+            Context manager for the batch
+        """
+        return ConfigBatch(self)
+    
     def get(self, section: str, option: str, fallback: Any = None) -> str:
         """
         Get a configuration value.
@@ -185,11 +269,17 @@ class ConfigHandler:
             option: Option name
             value: New value
         """
+        value = str(value)
+        
         # Create section if it doesn't exist
         if not self.config.has_section(section):
             self.config.add_section(section)
+        elif self.config.get(section, option, raw=True, fallback=None) == value:
+            # Unchanged; leave the config (and any pending batch) clean
+            return
             
-        self.config[section][option] = str(value)
+        self.config[section][option] = value
+        self._dirty = True
     
     def get_all(self) -> Dict[str, Dict[str, str]]:
         """
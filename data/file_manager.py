@@ -6,11 +6,38 @@ import os
 import shutil
 import logging
 import re
-from typing import List, Optional, Tuple
+from collections import deque
+from typing import Iterator, List, Optional, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+def _iter_scandir(top: str) -> Iterator[os.DirEntry]:
+    """
+    Yield every file entry below top, walking directories iteratively.
+    
+    Uses an explicit stack instead of os.walk, so file/directory checks come
+    from the cached DirEntry type and deep trees cannot exhaust the call stack.
+    Directories that cannot be read are skipped.
+    
+    Args:
+        top: Directory to walk
+        
+    Yields:
+        os.DirEntry for each regular file
+    """
+    stack = deque([top])
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError:
+            continue
+
 class FileManager:
     """Class to handle file operations and organization."""
     
@@ -206,8 +233,11 @@ class FileManager:
             if pattern:
                 return list(str(p) for p in Path(directory).glob(pattern))
             else:
-                return [os.path.join(directory, f) for f in os.listdir(directory) 
-                        if os.path.isfile(os.path.join(directory, f))]
+                # DirEntry.is_file() uses the type cached by the directory
+                # read, so there is no extra stat per entry
+                with os.scandir(directory) as it:
+                    return [os.path.join(directory, entry.name) for entry in it
+                            if entry.is_file()]
         except Exception as e:
             logger.error(f"Error listing files: {str(e)}")
             return []
@@ -308,14 +338,12 @@ class FileManager:
         """
         total_size = 0
         
-        for dirpath, dirnames, filenames in os.walk(directory):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                try:
-                    total_size += os.path.getsize(filepath)
-                except (FileNotFoundError, PermissionError):
-                    # Skip files that cannot be accessed
-                    pass
+        for entry in _iter_scandir(directory):
+            try:
+                total_size += entry.stat(follow_symlinks=False).st_size
+            except (FileNotFoundError, PermissionError):
+                # Skip files that cannot be accessed
+                pass
                     
         return total_size
     
@@ -337,8 +365,9 @@ class FileManager:
             return []
             
         try:
-            return [os.path.join(parent_dir, d) for d in os.listdir(parent_dir) 
-                   if os.path.isdir(os.path.join(parent_dir, d))]
+            with os.scandir(parent_dir) as it:
+                return [os.path.join(parent_dir, entry.name) for entry in it
+                        if entry.is_dir()]
         except Exception as e:
             logger.error(f"Error listing directories: {str(e)}")
             return []
\ No newline at end of file
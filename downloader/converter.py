@@ -150,7 +150,9 @@ class AudioConverter:
             os.makedirs(output_dir, exist_ok=True)
             
         try:
-            command = ["ffmpeg", "-i", input_file]
+            # No stdin (so an overwrite prompt can't block the call) and only
+            # errors on stderr, which is all that is read back
+            command = ["ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error", "-i", input_file]
             
             # Add any additional arguments
             if ffmpeg_args:
@@ -162,7 +164,7 @@ class AudioConverter:
             # Run FFmpeg process
             result = subprocess.run(
                 command,
-                stdout=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
                 text=True,
                 check=True
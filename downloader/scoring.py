@@ -24,6 +24,9 @@ class ScoringSystem:
         self.scores_file = scores_file
         self.scores_data = self._load_scores()
         
+        # Videos flagged as new releases, built on demand by _get_new_releases
+        self._new_releases = None
+        
     def _load_scores(self) -> Dict:
         """
         Load the scores from file.
@@ -45,6 +48,21 @@ class ScoringSystem:
             logger.info(f"Scores file not found. Creating new scores file.")
             return self._create_default_scores()
     
+    def _get_new_releases(self) -> List[Dict]:
+        """
+        Get the videos flagged as new releases.
+        
+        The list is kept between calls and rebuilt only after video metadata
+        changes, instead of rescanning every video on each top videos query.
+        
+        Returns:
+            List of video data dictionaries for new releases
+        """
+        if self._new_releases is None:
+            self._new_releases = [v for v in self.scores_data["videos"].values()
+                                  if v.get("is_new_release", False)]
+        return self._new_releases
+    
     def _create_default_scores(self) -> Dict:
         """Create a default scores structure."""
         return {
@@ -174,6 +192,9 @@ class ScoringSystem:
                     except ValueError:
                         pass
             
+            # The new release flag may have changed
+            self._new_releases = None
+            
             # Calculate base score
             self._calculate_base_score(video_id)
             
@@ -405,8 +426,7 @@ class ScoringSystem:
             # Ensure new releases get exposure
             if include_new_releases:
                 # Find any new releases not already in the top videos
-                new_releases = [v for v in self.scores_data["videos"].values() 
-                               if v.get("is_new_release", False)]
+                new_releases = self._get_new_releases()
                 
                 # Ensure at least 20% of results are new releases if available
                 min_new_releases = max(1, limit // 5)
@@ -3,14 +3,102 @@ Enhanced download tracker module.
 An enhanced version of the tracker that includes playlist names in the download history.
 """
 import os
+import sys
 import json
+import functools
 import logging
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import time
 
+try:
+    # Optional faster parser; its JSONDecodeError subclasses json's
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+def _playlist_id_from_url(url: str) -> Optional[str]:
+    """
+    Extract the value of the first non-empty list= parameter in a URL.
+    
+    Plain string searching gives the same result as re.search(r'list=([^&]+)')
+    without going through the regex engine.
+    
+    Args:
+        url: Playlist or watch URL
+        
+    Returns:
+        The playlist ID, or None if the URL has none
+    """
+    start = url.find('list=')
+    while start != -1:
+        start += 5
+        end = url.find('&', start)
+        if end == -1:
+            end = len(url)
+        if end > start:
+            return url[start:end]
+        start = url.find('list=', start)
+    return None
+
+# Upper bound on threads used to list playlist folders
+_MAX_LISTING_WORKERS = 8
+
+# How long a directory listing from _dir_files is reused, in seconds
+_DIR_CACHE_SECONDS = 5
+
+@functools.lru_cache(maxsize=256)
+def _list_dir_files(directory: str, epoch: int) -> frozenset:
+    """List the case-normalized file names in a directory (empty if it cannot be read)."""
+    try:
+        with os.scandir(directory) as it:
+            return frozenset(os.path.normcase(entry.name) for entry in it if entry.is_file())
+    except OSError:
+        return frozenset()
+
+def _dir_files(directory: str) -> frozenset:
+    """
+    Get the file names in a directory, reusing recent listings.
+    
+    The page refreshes check the same folders over and over; a listing is
+    reused for up to _DIR_CACHE_SECONDS, after which the epoch argument
+    changes and the directory is read again. Recording a new download
+    clears the cache so the new file shows up immediately.
+    """
+    return _list_dir_files(directory, int(time.monotonic() // _DIR_CACHE_SECONDS))
+
+def _intern(value):
+    """Intern a string; other values are returned unchanged."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+def _intern_playlist_refs(videos: Dict) -> None:
+    """
+    Intern the playlist IDs and names stored on each video.
+    
+    A playlist's ID and name are repeated on every video that belongs to it,
+    and the JSON parser gives each occurrence its own string. Interning lets
+    all videos of a playlist share one copy.
+    
+    Args:
+        videos: The "videos" mapping of the download history, updated in place
+    """
+    for video_info in videos.values():
+        playlists = video_info.get("playlists")
+        if isinstance(playlists, list):
+            video_info["playlists"] = [_intern(p) for p in playlists]
+        for playlist in video_info.get("playlist_info") or ():
+            if isinstance(playlist, dict):
+                if "id" in playlist:
+                    playlist["id"] = _intern(playlist["id"])
+                if "name" in playlist:
+                    playlist["name"] = _intern(playlist["name"])
+
 class EnhancedDownloadTracker:
     """Enhanced class to track downloaded videos with playlist names."""
     
@@ -28,6 +116,11 @@ class EnhancedDownloadTracker:
         self.download_history = self._load_download_history()
         self.playlists = self._load_playlists()
         
+        # Playlist ID -> name, built on demand (see _get_playlist_name)
+        self._playlist_names = None
+        # Playlist URL -> playlist, built on demand (see get_playlist)
+        self._playlists_by_url = None
+        
         # Upgrade existing history file to include playlist names if needed
         self._upgrade_history_with_playlist_names()
     
@@ -40,8 +133,11 @@ class EnhancedDownloadTracker:
         """
         if os.path.exists(self.history_file):
             try:
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                # Parse the raw bytes; both parsers decode UTF-8 themselves
+                with open(self.history_file, 'rb') as f:
+                    history = _json_loads(f.read())
+                _intern_playlist_refs(history.get("videos", {}))
+                return history
             except json.JSONDecodeError:
                 logger.error(f"Invalid JSON in {self.history_file}. Creating new history.")
                 return {"videos": {}, "last_updated": datetime.now().isoformat()}
@@ -72,10 +168,10 @@ class EnhancedDownloadTracker:
             with open(self.history_file, 'w', encoding='utf-8') as f:
                 json.dump(self.download_history, f, indent=2, ensure_ascii=False)
             
-            print(f"Successfully saved download history to {self.history_file}")
+            logger.debug(f"Successfully saved download history to {self.history_file}")
             return True
         except Exception as e:
-            print(f"Error saving download history: {str(e)}")
+            logger.error(f"Error saving download history: {str(e)}")
             return False
     
     def _load_playlists(self) -> Dict:
@@ -87,8 +183,9 @@ class EnhancedDownloadTracker:
         """
         if os.path.exists(self.playlists_file):
             try:
-                with open(self.playlists_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                # Parse the raw bytes; both parsers decode UTF-8 themselves
+                with open(self.playlists_file, 'rb') as f:
+                    return _json_loads(f.read())
             except json.JSONDecodeError:
                 logger.error(f"Invalid JSON in {self.playlists_file}. Creating new playlists file.")
                 return {"playlists": []}
@@ -127,15 +224,19 @@ class EnhancedDownloadTracker:
         Returns:
             Playlist name or None if not found
         """
-        for playlist in self.playlists["playlists"]:
-            # Extract playlist ID from URL
-            import re
-            url = playlist.get("url", "")
-            match = re.search(r'list=([^&]+)', url)
-            if match and match.group(1) == playlist_id:
-                return playlist.get("name", "Unknown Playlist")
-        
-        return "Unknown Playlist"
+        # Extract the IDs from the playlist URLs once, not on every lookup;
+        # add_playlist and remove_playlist reset the index
+        if self._playlist_names is None:
+            names = {}
+            for playlist in self.playlists["playlists"]:
+                # URLs without list= never matched any ID; keep them out
+                # so a None lookup still gets "Unknown Playlist"
+                url_id = _playlist_id_from_url(playlist.get("url", ""))
+                if url_id is not None:
+                    names.setdefault(url_id, playlist.get("name", "Unknown Playlist"))
+            self._playlist_names = names
+        
+        return self._playlist_names.get(playlist_id, "Unknown Playlist")
     
     def _upgrade_history_with_playlist_names(self) -> None:
         """
@@ -185,10 +286,9 @@ class EnhancedDownloadTracker:
             name = f"Playlist {len(self.playlists['playlists']) + 1}"
         
         # Check if playlist already exists
-        for playlist in self.playlists["playlists"]:
-            if playlist["url"] == url:
-                logger.warning(f"Playlist {url} already exists.")
-                return False
+        if self.get_playlist(url) is not None:
+            logger.warning(f"Playlist {url} already exists.")
+            return False
         
         # Add the playlist
         playlist_info = {
@@ -200,6 +300,8 @@ class EnhancedDownloadTracker:
         }
         
         self.playlists["playlists"].append(playlist_info)
+        self._playlist_names = None
+        self._playlists_by_url = None
         
         # Update any existing videos from this playlist with the correct name
         self._update_videos_with_playlist_name(url, name)
@@ -215,12 +317,9 @@ class EnhancedDownloadTracker:
             playlist_name: Name of the playlist
         """
         # Extract playlist ID from URL
-        import re
-        match = re.search(r'list=([^&]+)', playlist_url)
-        if not match:
+        playlist_id = _playlist_id_from_url(playlist_url)
+        if not playlist_id:
             return
-            
-        playlist_id = match.group(1)
         
         # Update all videos that belong to this playlist
         for video_id, video_info in self.download_history["videos"].items():
@@ -255,6 +354,8 @@ class EnhancedDownloadTracker:
         """
         initial_count = len(self.playlists["playlists"])
         self.playlists["playlists"] = [p for p in self.playlists["playlists"] if p["url"] != url]
+        self._playlist_names = None
+        self._playlists_by_url = None
         
         if len(self.playlists["playlists"]) < initial_count:
             logger.info(f"Removed playlist: {url}")
@@ -272,6 +373,24 @@ class EnhancedDownloadTracker:
         """
         return self.playlists["playlists"]
     
+    def get_playlist(self, url: str) -> Optional[Dict]:
+        """
+        Get a tracked playlist by its URL.
+        
+        Args:
+            url: URL of the playlist
+            
+        Returns:
+            Playlist dictionary or None if not tracked
+        """
+        # Index the playlists by URL once; add_playlist and remove_playlist reset it
+        if self._playlists_by_url is None:
+            self._playlists_by_url = {}
+            for playlist in self.playlists["playlists"]:
+                self._playlists_by_url.setdefault(playlist["url"], playlist)
+        
+        return self._playlists_by_url.get(url)
+    
     def update_playlist_check_time(self, url: str) -> bool:
         """
         Update the last checked time for a playlist.
@@ -282,10 +401,10 @@ class EnhancedDownloadTracker:
         Returns:
             True if updated successfully, False if not found
         """
-        for playlist in self.playlists["playlists"]:
-            if playlist["url"] == url:
-                playlist["last_checked"] = datetime.now().isoformat()
-                return self._save_playlists()
+        playlist = self.get_playlist(url)
+        if playlist is not None:
+            playlist["last_checked"] = datetime.now().isoformat()
+            return self._save_playlists()
         
         logger.warning(f"Playlist not found: {url}")
         return False
@@ -311,7 +430,8 @@ class EnhancedDownloadTracker:
         Returns:
             True if added successfully, False otherwise
         """
-        print(f"Adding video to history: {video_id}, {title}")
+        logger.debug(f"Adding video to history: {video_id}, {title}")
+        _list_dir_files.cache_clear()
         now = datetime.now().isoformat()
         
         # Get the playlist name
@@ -513,6 +633,86 @@ class EnhancedDownloadTracker:
         """
         return video_id in self.download_history["videos"]
     
+    def get_video_file_path(self, video_id: str) -> Optional[str]:
+        """
+        Get the file path of a downloaded video.
+        
+        Args:
+            video_id: YouTube video ID
+            
+        Returns:
+            Path to the downloaded file, or None if the video is not in the history
+        """
+        video_info = self.download_history["videos"].get(video_id)
+        if video_info is None:
+            return None
+        return video_info.get("file_path")
+    
+    def get_existing_video_ids(self, video_ids: Optional[List[str]] = None) -> set:
+        """
+        Find which downloaded videos still have their audio file on disk.
+        
+        Files are grouped by directory and each directory is listed once,
+        instead of checking every file separately.
+        
+        Args:
+            video_ids: Optional IDs to check (default: the whole history)
+            
+        Returns:
+            Set of video IDs whose file exists
+        """
+        videos = self.download_history["videos"]
+        if video_ids is None:
+            # Snapshot the IDs; this may run off the GUI thread during a download
+            video_ids = list(videos)
+        
+        # Group (video_id, file name) pairs by directory; names are compared
+        # with normcase so case-insensitive file systems match like os.path.exists
+        by_dir = defaultdict(list)
+        for video_id in video_ids:
+            video_info = videos.get(video_id)
+            file_path = video_info.get("file_path") if video_info else None
+            if file_path:
+                directory, filename = os.path.split(file_path)
+                by_dir[directory].append((video_id, os.path.normcase(filename)))
+        
+        # Playlists each get their own folder; list them in parallel so slow
+        # disks or network shares are waited on concurrently
+        directories = list(by_dir)
+        if len(directories) > 1:
+            workers = min(_MAX_LISTING_WORKERS, len(directories))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                listings = list(executor.map(_dir_files, [d or "." for d in directories]))
+        else:
+            listings = [_dir_files(d or ".") for d in directories]
+        
+        existing = set()
+        for directory, present in zip(directories, listings):
+            existing.update(video_id for video_id, filename in by_dir[directory]
+                            if filename in present)
+        
+        return existing
+    
+    def get_playlist_video_counts(self) -> Dict[str, int]:
+        """
+        Count the downloaded videos still on disk for each tracked playlist.
+        
+        All files are checked in one batch (see get_existing_video_ids), so
+        the cost is one directory listing per folder, not one check per file.
+        
+        Returns:
+            Dictionary mapping each tracked playlist URL to its video count
+        """
+        videos = self.download_history["videos"]
+        counts = Counter()
+        for video_id in self.get_existing_video_ids():
+            counts.update(set(videos.get(video_id, {}).get("playlists", ())))
+        
+        return {
+            playlist["url"]: counts.get(_playlist_id_from_url(playlist.get("url", "")), 0)
+            for playlist in list(self.playlists["playlists"])
+        }
+    
     def get_downloaded_videos(self, playlist_id: Optional[str] = None) -> List[Dict]:
         """
         Get all downloaded videos, optionally filtered by playlist.
@@ -531,29 +731,58 @@ class EnhancedDownloadTracker:
                 if "playlists" not in video_info or playlist_id not in video_info["playlists"]:
                     continue
             
-            # Create a copy of video info with additional fields
-            video_data = {
-                "id": video_id,
-                "title": video_info["title"],
-                "file_path": video_info["file_path"],
-                "downloaded_on": video_info["downloaded_on"],
-                "view_count": video_info.get("view_count", 0),
-                "view_count_updated": video_info.get("view_count_updated")
-            }
+            videos.append(self._video_data(video_id, video_info))
+        
+        return videos
+    
+    def get_downloaded_video(self, video_id: str) -> Optional[Dict]:
+        """
+        Get a single downloaded video, in the same form as get_downloaded_videos.
+        
+        Args:
+            video_id: YouTube video ID
             
-            # Add the enhanced playlist information
-            if "playlist_info" in video_info:
-                video_data["playlist_info"] = video_info["playlist_info"]
-            elif "playlists" in video_info:
-                # Create basic playlist info from IDs if needed
-                video_data["playlist_info"] = []
-                for p_id in video_info["playlists"]:
-                    name = self._get_playlist_name(p_id)
-                    video_data["playlist_info"].append({"id": p_id, "name": name})
+        Returns:
+            Video dictionary with enhanced playlist information, or None if the
+            video is not in the history
+        """
+        video_info = self.download_history["videos"].get(video_id)
+        if video_info is None:
+            return None
+        return self._video_data(video_id, video_info)
+    
+    def _video_data(self, video_id: str, video_info: Dict) -> Dict:
+        """
+        Build the dictionary handed out for a downloaded video.
+        
+        Args:
+            video_id: YouTube video ID
+            video_info: The video's download history entry
             
-            videos.append(video_data)
+        Returns:
+            Copy of the video info with additional fields
+        """
+        # Create a copy of video info with additional fields
+        video_data = {
+            "id": video_id,
+            "title": video_info["title"],
+            "file_path": video_info["file_path"],
+            "downloaded_on": video_info["downloaded_on"],
+            "view_count": video_info.get("view_count", 0),
+            "view_count_updated": video_info.get("view_count_updated")
+        }
         
-        return videos
+        # Add the enhanced playlist information
+        if "playlist_info" in video_info:
+            video_data["playlist_info"] = video_info["playlist_info"]
+        elif "playlists" in video_info:
+            # Create basic playlist info from IDs if needed
+            video_data["playlist_info"] = []
+            for p_id in video_info["playlists"]:
+                name = self._get_playlist_name(p_id)
+                video_data["playlist_info"].append({"id": p_id, "name": name})
+        
+        return video_data
     
     def get_video_stats(self) -> Dict:
         """
@@ -575,34 +804,35 @@ class EnhancedDownloadTracker:
         if not self.download_history["videos"]:
             return stats
             
-        # Calculate statistics
-        for video_id, video_info in self.download_history["videos"].items():
-            view_count = video_info.get("view_count", 0)
-            stats["total_views"] += view_count
-            
-            # Track max views
-            if view_count > stats["max_views"]:
-                stats["max_views"] = view_count
-                stats["max_views_video"] = {
-                    "id": video_id,
-                    "title": video_info["title"],
-                    "view_count": view_count
-                }
-                
-            # Compare dates for newest/oldest if upload_date is available
-            upload_date = video_info.get("upload_date")
-            if upload_date:
-                video_date = {
+        # Pull the needed fields out into parallel columns once, so the
+        # totals and extremes below run as builtin passes over plain lists
+        videos = self.download_history["videos"]
+        video_ids = list(videos)
+        view_counts = [video_info.get("view_count", 0) for video_info in videos.values()]
+        
+        stats["total_views"] = sum(view_counts)
+        
+        # Track max views (first video wins a tie)
+        top = max(range(len(view_counts)), key=view_counts.__getitem__)
+        if view_counts[top] > 0:
+            stats["max_views"] = view_counts[top]
+            stats["max_views_video"] = {
+                "id": video_ids[top],
+                "title": videos[video_ids[top]]["title"],
+                "view_count": view_counts[top]
+            }
+        
+        # Compare dates for newest/oldest if upload_date is available
+        dated = [(video_info["upload_date"], video_id)
+                 for video_id, video_info in videos.items() if video_info.get("upload_date")]
+        if dated:
+            for key, pick in (("newest_video", max), ("oldest_video", min)):
+                upload_date, video_id = pick(dated, key=itemgetter(0))
+                stats[key] = {
                     "id": video_id,
-                    "title": video_info["title"],
+                    "title": videos[video_id]["title"],
                     "date": upload_date
                 }
-                
-                if stats["newest_video"] is None or upload_date > stats["newest_video"]["date"]:
-                    stats["newest_video"] = video_date
-                    
-                if stats["oldest_video"] is None or upload_date < stats["oldest_video"]["date"]:
-                    stats["oldest_video"] = video_date
         
         # Calculate average views
         if stats["total_videos"] > 0:
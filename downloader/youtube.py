@@ -5,7 +5,6 @@ Responsible for downloading videos from YouTube playlists.
 import os
 import logging
 from typing import Dict, List, Optional, Tuple
-import yt_dlp
 from data.config_manager import ConfigHandler
 from utils.path_utils import clean_output_path
 
@@ -35,6 +34,10 @@ class YouTubeDownloader:
         # Store the tracker reference
         self.tracker = tracker
         
+        # Scoring system updated after each download (see _get_scoring)
+        self._scoring = None
+        self._scoring_mtime = None
+        
         # Explicitly set FFmpeg path for yt-dlp
         from downloader.converter import FFMPEG_PATH
         if FFMPEG_PATH:
@@ -48,6 +51,37 @@ class YouTubeDownloader:
             os.makedirs(self.output_dir, exist_ok=True)
             logger.info(f"Created output directory: {self.output_dir}")
     
+    @staticmethod
+    def _scores_mtime(scores_file: str) -> Optional[int]:
+        """Get the modification time of the scores file, or None if missing."""
+        try:
+            return os.stat(scores_file).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _get_scoring(self):
+        """
+        Get the scoring system to record downloaded videos in.
+        
+        The instance is kept between downloads instead of re-reading the
+        scores file for every video; it is only reloaded when something else
+        has written the file since our last update.
+        
+        Returns:
+            ScoringSystem instance
+        """
+        from downloader.scoring import ScoringSystem
+        from utils.path_utils import get_data_path
+        
+        # Use path_utils to get the correct path
+        scores_file = get_data_path("video_scores.json")
+        mtime = self._scores_mtime(scores_file)
+        if (self._scoring is None or self._scoring.scores_file != scores_file
+                or mtime != self._scoring_mtime):
+            self._scoring = ScoringSystem(scores_file)
+            self._scoring_mtime = mtime
+        return self._scoring
+    
     def get_video_info(self, video_url: str) -> Optional[Dict]:
         """
         Get detailed information about a YouTube video including view count and comments.
@@ -68,6 +102,7 @@ class YouTubeDownloader:
         }
         
         try:
+            import yt_dlp  # yt-dlp is slow to import, so load it on first use
             with yt_dlp.YoutubeDL(options) as ydl:
                 info = ydl.extract_info(video_url, download=False)
                 
@@ -164,6 +199,7 @@ class YouTubeDownloader:
                     'preferredquality': str(bitrate_value),
                 }]
             
+            import yt_dlp
             with yt_dlp.YoutubeDL(options) as ydl:
                 logger.info(f"Downloading video: {video_url}")
                 info = ydl.extract_info(video_url, download=True)
@@ -212,13 +248,18 @@ class YouTubeDownloader:
                     'url': video_url
                 }
                 
+                # Playlist ID from the video URL, parsed once for both the
+                # scoring system and the tracker below
+                url_playlist_id = None
+                if "list=" in video_url:
+                    import re
+                    playlist_match = re.search(r'list=([^&]+)', video_url)
+                    if playlist_match:
+                        url_playlist_id = playlist_match.group(1)
+                
                 # Update the scoring system with video metadata
                 try:
-                    from downloader.scoring import ScoringSystem
-                    from utils.path_utils import get_data_path
-                    
-                    # Use path_utils to get the correct path
-                    scoring = ScoringSystem(get_data_path("video_scores.json"))
+                    scoring = self._get_scoring()
                     
                     # Determine if this is a new release (less than 14 days old)
                     is_new_release = False
@@ -242,23 +283,19 @@ class YouTubeDownloader:
                         is_new_release=is_new_release
                     )
                     
-                    # Extract playlist ID if available
-                    playlist_id = None
-                    if playlist_name and "list=" in video_url:
-                        import re
-                        playlist_match = re.search(r'list=([^&]+)', video_url)
-                        if playlist_match:
-                            playlist_id = playlist_match.group(1)
-                            
-                            # Update playlist in scoring system if we have a playlist ID
-                            if playlist_id:
-                                logger.info(f"Updating playlist in scoring system: {playlist_id}")
-                                # Default values for initial playlist addition
-                                scoring.update_playlist_performance(
-                                    playlist_id=playlist_id,
-                                    name=playlist_name,
-                                    viewer_change=0  # Default neutral value for initial addition
-                                )
+                    # Update playlist in scoring system if we have a playlist ID
+                    playlist_id = url_playlist_id if playlist_name else None
+                    if playlist_id:
+                        logger.info(f"Updating playlist in scoring system: {playlist_id}")
+                        # Default values for initial playlist addition
+                        scoring.update_playlist_performance(
+                            playlist_id=playlist_id,
+                            name=playlist_name,
+                            viewer_change=0  # Default neutral value for initial addition
+                        )
+                    
+                    # Our own saves changed the file; don't reload for them
+                    self._scoring_mtime = self._scores_mtime(scoring.scores_file)
                     
                     logger.info(f"Updated scoring system for video: {video_data['title']}")
                     
@@ -273,34 +310,12 @@ class YouTubeDownloader:
                         # Extract video ID
                         video_id = video_data['id']
                         
-                        # Default playlist ID for single videos
-                        playlist_id = "other_videos"
-                        
-                        # Extract playlist ID if available
-                        if "list=" in video_url:
-                            import re
-                            playlist_match = re.search(r'list=([^&]+)', video_url)
-                            if playlist_match:
-                                playlist_id = playlist_match.group(1)
-                        
-                        # This prevents the duplication of paths
-                        from utils.path_utils import get_path
-                        
-                        # Get the absolute app root path
-                        app_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+                        # Playlist ID if available, else the default for single videos
+                        playlist_id = url_playlist_id or "other_videos"
                         
-                        # Convert absolute path to relative path from app root
-                        if downloaded_file.startswith(app_root):
-                            relative_path = os.path.relpath(downloaded_file, app_root)
-                            logger.info(f"Converting path from '{downloaded_file}' to '{relative_path}'")
-                            file_path_to_store = relative_path
-                        else:
-                            # If not under app root, keep the original path
-                            file_path_to_store = downloaded_file
-
-                        # Add to download history
+                        # Add to download history; clean_output_path collapses
+                        # any duplicated data/audio prefix in the stored path
                         logger.info(f"Adding to download history: {video_data['title']}")
-                        # Before adding to download history, clean the path
                         file_path_to_store = clean_output_path(downloaded_file)
 
                         self.tracker.add_downloaded_video(
@@ -330,78 +345,99 @@ class YouTubeDownloader:
             logger.debug(traceback.format_exc())
             return None
     
-    def get_playlist_videos(self, playlist_url: str) -> List[Dict]:
+    def get_playlist_videos(self, playlist_url: str, detailed: bool = True) -> List[Dict]:
         """
         Get information about all videos in a playlist without downloading them.
         
         Args:
             playlist_url: URL of the YouTube playlist
+            detailed: Also fetch each video's view count, comment count and
+                upload date (one request per video). When False, only the
+                single flat playlist request is made and those fields keep
+                their defaults.
             
         Returns:
             List of dictionaries containing video information
         """
+        videos = self._list_playlist(playlist_url)
+        if videos is None:
+            return []
+        if not detailed:
+            return videos
+        
+        for video_info in videos:
+            video_url = video_info['url']
+            
+            # Attempt to get detailed info including view count, comment count, and upload date
+            try:
+                detailed_info = self.get_video_info(video_url)
+                if detailed_info:
+                    # Update with detailed info if available
+                    video_info['view_count'] = detailed_info.get('view_count', 0)
+                    video_info['comment_count'] = detailed_info.get('comment_count', 0)
+                    video_info['upload_date'] = detailed_info.get('upload_date')
+                    
+                    # If duration wasn't in flat info, get it from detailed info
+                    if not video_info['duration'] and 'duration' in detailed_info:
+                        video_info['duration'] = detailed_info['duration']
+                        
+                    # Copy any additional metadata that might be useful
+                    for key in ['like_count', 'dislike_count', 'categories', 'tags']:
+                        if key in detailed_info:
+                            video_info[key] = detailed_info[key]
+            except Exception as e:
+                logger.warning(f"Could not get detailed info for {video_url}: {str(e)}")
+        
+        return videos
+    
+    def _list_playlist(self, playlist_url: str) -> Optional[List[Dict]]:
+        """
+        Fetch the flat listing of a playlist in a single request.
+        
+        Args:
+            playlist_url: URL of the YouTube playlist
+            
+        Returns:
+            List of basic video dictionaries, or None if retrieval failed
+        """
         options = {
-            'extract_flat': True,  # First use extract_flat to get video IDs quickly
+            'extract_flat': True,  # Only video IDs and titles, no per-video requests
             'skip_download': True,
             'quiet': True,
             'no_warnings': True,
         }
         
         try:
+            import yt_dlp
             with yt_dlp.YoutubeDL(options) as ydl:
                 playlist_info = ydl.extract_info(playlist_url, download=False)
                 
                 if 'entries' not in playlist_info:
                     logger.error(f"No videos found in playlist: {playlist_url}")
-                    return []
+                    return None
                 
-                # Extract basic info for each video and then get detailed info
+                # Extract basic info for each video
                 videos = []
                 for entry in playlist_info['entries']:
                     if entry:
-                        video_url = f"https://www.youtube.com/watch?v={entry.get('id')}"
-                        
-                        # Get basic info from the flat extraction
-                        video_info = {
+                        videos.append({
                             'id': entry.get('id'),
                             'title': entry.get('title'),
-                            'url': video_url,
+                            'url': f"https://www.youtube.com/watch?v={entry.get('id')}",
                             'duration': entry.get('duration', 0),
                             'uploader': entry.get('uploader'),
                             'view_count': 0,  # Default value, will try to update
                             'comment_count': 0,  # Default value for comments
                             'upload_date': None  # Default value for upload date
-                        }
-                        
-                        # Attempt to get detailed info including view count, comment count, and upload date
-                        try:
-                            detailed_info = self.get_video_info(video_url)
-                            if detailed_info:
-                                # Update with detailed info if available
-                                video_info['view_count'] = detailed_info.get('view_count', 0)
-                                video_info['comment_count'] = detailed_info.get('comment_count', 0)
-                                video_info['upload_date'] = detailed_info.get('upload_date')
-                                
-                                # If duration wasn't in flat info, get it from detailed info
-                                if not video_info['duration'] and 'duration' in detailed_info:
-                                    video_info['duration'] = detailed_info['duration']
-                                    
-                                # Copy any additional metadata that might be useful
-                                for key in ['like_count', 'dislike_count', 'categories', 'tags']:
-                                    if key in detailed_info:
-                                        video_info[key] = detailed_info[key]
-                        except Exception as e:
-                            logger.warning(f"Could not get detailed info for {video_url}: {str(e)}")
-                        
-                        videos.append(video_info)
+                        })
                 
                 logger.info(f"Found {len(videos)} videos in playlist: {playlist_url}")
                 return videos
                 
         except Exception as e:
             logger.error(f"Error retrieving playlist {playlist_url}: {str(e)}")
-            return []
-            
+            return None
+    
     def download_playlist(self, playlist_url: str, audio_only: bool = True, playlist_name: Optional[str] = None) -> Tuple[List[Dict], List[str]]:
         """
         Download all videos from a YouTube playlist.
@@ -414,7 +450,9 @@ class YouTubeDownloader:
         Returns:
             Tuple of (list of successful downloads, list of failed video IDs)
         """
-        videos = self.get_playlist_videos(playlist_url)
+        # Only IDs, titles and URLs are needed here; download_video fetches
+        # each video's full info itself
+        videos = self.get_playlist_videos(playlist_url, detailed=False)
         
         successful = []
         failed = []
@@ -1,5 +1,11 @@
 """GUI package for YouTube Playlist Downloader."""
-# Import statements for making components available
-from gui.main_window import YouTubePlaylistDownloaderApp
+# The main window pulls in PyQt5 and every page, so it is only imported on
+# first access (PEP 562); importing e.g. gui.utils stays lightweight.
 
 __all__ = ['YouTubePlaylistDownloaderApp']
+
+def __getattr__(name):
+    if name == 'YouTubePlaylistDownloaderApp':
+        from gui.main_window import YouTubePlaylistDownloaderApp
+        return YouTubePlaylistDownloaderApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
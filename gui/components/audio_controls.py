@@ -1,11 +1,11 @@
 """
 Audio controls component for the player.
 """
-import os
 from PyQt5.QtWidgets import QWidget, QHBoxLayout, QPushButton
-from PyQt5.QtGui import QIcon
 from PyQt5.QtCore import Qt, pyqtSignal, QSize
 
+from gui.utils.icon_provider import IconProvider
+
 class AudioControls(QWidget):
     """Audio control buttons for playback."""
     
@@ -25,15 +25,11 @@ class AudioControls(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(10)
         
-        # Get icons directory
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        icons_dir = os.path.join(base_dir, "icons")
-        
         # Previous button
         self.previous_button = QPushButton()
-        icon_path = os.path.join(icons_dir, "skip_previous.svg")
-        if os.path.exists(icon_path):
-            self.previous_button.setIcon(QIcon(icon_path))
+        icon = IconProvider.get("skip_previous.svg")
+        if icon:
+            self.previous_button.setIcon(icon)
         else:
             self.previous_button.setText("Prev")
         self.previous_button.setIconSize(QSize(24, 24))
@@ -54,11 +50,11 @@ class AudioControls(QWidget):
         
         # Play/Pause button
         self.play_pause_button = QPushButton()
-        self.play_icon_path = os.path.join(icons_dir, "play_circle.svg")
-        self.pause_icon_path = os.path.join(icons_dir, "pause_circle.svg")
+        self.play_icon = IconProvider.get("play_circle.svg")
+        self.pause_icon = IconProvider.get("pause_circle.svg")
         
-        if os.path.exists(self.play_icon_path):
-            self.play_pause_button.setIcon(QIcon(self.play_icon_path))
+        if self.play_icon:
+            self.play_pause_button.setIcon(self.play_icon)
         else:
             self.play_pause_button.setText("Play")
             
@@ -80,9 +76,9 @@ class AudioControls(QWidget):
         
         # Next button
         self.next_button = QPushButton()
-        icon_path = os.path.join(icons_dir, "skip_next.svg")
-        if os.path.exists(icon_path):
-            self.next_button.setIcon(QIcon(icon_path))
+        icon = IconProvider.get("skip_next.svg")
+        if icon:
+            self.next_button.setIcon(icon)
         else:
             self.next_button.setText("Next")
         self.next_button.setIconSize(QSize(24, 24))
@@ -127,13 +123,13 @@ class AudioControls(QWidget):
         
         if self.is_playing:
             # We're playing, so show pause button
-            if os.path.exists(self.pause_icon_path):
-                self.play_pause_button.setIcon(QIcon(self.pause_icon_path))
+            if self.pause_icon:
+                self.play_pause_button.setIcon(self.pause_icon)
             else:
                 self.play_pause_button.setText("Pause")
         else:
             # We're paused, so show play button
-            if os.path.exists(self.play_icon_path):
-                self.play_pause_button.setIcon(QIcon(self.play_icon_path))
+            if self.play_icon:
+                self.play_pause_button.setIcon(self.play_icon)
             else:
                 self.play_pause_button.setText("Play")
\ No newline at end of file
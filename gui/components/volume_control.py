@@ -1,10 +1,10 @@
 """
 Volume control component.
 """
-import os
 from PyQt5.QtWidgets import QWidget, QHBoxLayout, QSlider, QLabel, QPushButton
 from PyQt5.QtCore import Qt, pyqtSignal, QSize
-from PyQt5.QtGui import QIcon
+
+from gui.utils.icon_provider import IconProvider
 
 class VolumeControl(QWidget):
     """Volume control slider with label."""
@@ -21,13 +21,9 @@ class VolumeControl(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(10)
         
-        # Get icons directory
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        icons_dir = os.path.join(base_dir, "icons")
-        
         # Volume icon button
         self.volume_icon = QPushButton()
-        self.volume_icon.setIcon(QIcon(os.path.join(icons_dir, "volume_up.svg")))
+        self._set_volume_icon("volume_up.svg")
         self.volume_icon.setIconSize(QSize(24, 24))
         self.volume_icon.setFixedSize(32, 32)
         self.volume_icon.setStyleSheet("""
@@ -82,20 +78,24 @@ class VolumeControl(QWidget):
         self.previous_volume = 80
         self.is_muted = False
         
+    def _set_volume_icon(self, name):
+        """Show the given shared icon on the mute button."""
+        icon = IconProvider.get(name)
+        if icon:
+            self.volume_icon.setIcon(icon)
+        
     def on_volume_changed(self, value):
         """Handle volume slider change."""
         self.volume_label.setText(f"{value}%")
         self.volume_changed.emit(value)
         
-        # Update mute state and icon
-        if value == 0:
-            self.is_muted = True
-            icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "icons", "volume_off.svg")
-            self.volume_icon.setIcon(QIcon(icon_path))
-        else:
-            self.is_muted = False
-            icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "icons", "volume_up.svg")
-            self.volume_icon.setIcon(QIcon(icon_path))
+        # Update mute state, swapping the icon only when it flips rather
+        # than on every tick of a slider drag
+        muted = value == 0
+        if muted != self.is_muted:
+            self.is_muted = muted
+            self._set_volume_icon("volume_off.svg" if muted else "volume_up.svg")
+        if not muted:
             self.previous_volume = value
     
     def toggle_mute(self):
@@ -103,15 +103,13 @@ class VolumeControl(QWidget):
         if self.is_muted:
             # Unmute
             self.volume_slider.setValue(self.previous_volume)
-            icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "icons", "volume_up.svg")
-            self.volume_icon.setIcon(QIcon(icon_path))
+            self._set_volume_icon("volume_up.svg")
             self.is_muted = False
         else:
             # Mute
             self.previous_volume = self.volume_slider.value()
             self.volume_slider.setValue(0)
-            icon_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "icons", "volume_off.svg")
-            self.volume_icon.setIcon(QIcon(icon_path))
+            self._set_volume_icon("volume_off.svg")
             self.is_muted = True
     
     def set_volume(self, volume):
@@ -21,14 +21,29 @@ class DownloadWorker(QThread):
         self.url = url
         self.operation_type = operation_type  # "playlist" or "video"
         self.playlist_name = playlist_name
+        self.tracker = None
         self.is_cancelled = False
         
+    def _get_tracker(self):
+        """
+        Get the tracker to record downloads in.
+        
+        This is deliberately not the dialog's tracker, which the downloader
+        already records each video in. The worker keeps its own history as
+        before, created once rather than re-read from disk for every video.
+        """
+        if not self.tracker:
+            from downloader.tracker import DownloadTracker
+            self.tracker = DownloadTracker()
+        return self.tracker
+        
     def run(self):
         try:
             if self.operation_type == "playlist":
                 # Get playlist videos
                 self.progress_signal.emit(10, "Loading playlist info...")
-                videos = self.downloader.get_playlist_videos(self.url)
+                # Titles and URLs are enough; each download fetches its own info
+                videos = self.downloader.get_playlist_videos(self.url, detailed=False)
                 
                 if not videos:
                     self.finished_signal.emit(False, "No videos found in playlist", 0, 0)
@@ -59,18 +74,9 @@ class DownloadWorker(QThread):
                     if result:
                         file_path, video_info = result
                         
-                        # Add to download history with proper metadata
-                        from downloader.tracker import DownloadTracker
-                        if hasattr(self, 'tracker') and self.tracker:
-                            # Use the provided tracker
-                            tracker = self.tracker
-                        else:
-                            # Create a new tracker as fallback
-                            tracker = DownloadTracker()
-                            
-                        # Add video to tracker
+                        # Add video to download history with proper metadata
                         video_id = video_info.get('id', '')
-                        tracker.add_downloaded_video(
+                        self._get_tracker().add_downloaded_video(
                             video_id=video_id,
                             playlist_id=playlist_id,
                             title=video_info.get('title', 'Unknown Title'),
@@ -98,15 +104,6 @@ class DownloadWorker(QThread):
                     video_id = video_info.get('id', '')
                     video_title = video_info.get('title', 'Unknown')
                     
-                    # Add to download history
-                    from downloader.tracker import DownloadTracker
-                    if hasattr(self, 'tracker') and self.tracker:
-                        # Use the provided tracker
-                        tracker = self.tracker
-                    else:
-                        # Create a new tracker as fallback
-                        tracker = DownloadTracker()
-                        
                     # Extract video ID from URL if not in video_info
                     if not video_id:
                         import re
@@ -119,8 +116,8 @@ class DownloadWorker(QThread):
                     # Special 'other' playlist ID for single videos
                     playlist_id = "other_videos"
                     
-                    # Add to tracker
-                    tracker.add_downloaded_video(
+                    # Add to download history
+                    self._get_tracker().add_downloaded_video(
                         video_id=video_id,
                         playlist_id=playlist_id,
                         title=video_title,
@@ -272,14 +269,9 @@ class DownloadDialog(QDialog):
         else:
             self.status_label.setText(f"{message}\n\nSuccessfully downloaded: {successful_count}\nFailed: {failed_count}")
             
-        # Make sure the tracker's files are saved
-        if self.tracker:
-            try:
-                # Ensure any pending tracker operations are committed
-                if hasattr(self.tracker, '_save_download_history'):
-                    self.tracker._save_download_history()
-            except Exception as e:
-                logging.error(f"Error saving tracker data: {str(e)}")
+        # No save is needed here: the worker thread's add_downloaded_video
+        # calls already wrote the history file, and rewriting it on the GUI
+        # thread would stall the dialog for large histories
         
         # Emit completion signal
         self.download_completed.emit(success, message)
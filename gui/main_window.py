@@ -10,8 +10,8 @@ from PyQt5.QtWidgets import (
     QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QMessageBox,
     QSlider, QSplitter, QSizePolicy
 )
-from PyQt5.QtCore import Qt, QSize, pyqtSignal, QUrl
-from PyQt5.QtGui import QFont, QPixmap, QIcon
+from PyQt5.QtCore import Qt, QSize, pyqtSignal, QUrl, QTimer
+from PyQt5.QtGui import QFont, QPixmap
 
 # Import backend components
 from data.config_manager import ConfigHandler
@@ -25,15 +25,13 @@ from gui.pages.playlists_page import PlaylistsPage
 from gui.pages.analytics_page import AnalyticsPage
 from gui.pages.settings_page import SettingsPage
 from gui.pages.about_page import AboutPage
+from gui.utils.icon_provider import IconProvider
 
 from utils.path_utils import get_audio_path, get_data_path, get_path
 
 # Import audio components
 from audio.player import AudioPlayer
 
-# Import PyQt stylesheet
-import qdarkstyle
-
 class YouTubePlaylistDownloaderApp(QWidget):
     """Main application window."""
     
@@ -55,6 +53,10 @@ class YouTubePlaylistDownloaderApp(QWidget):
         # Pass tracker to downloader
         self.downloader = YouTubeDownloader(self.output_dir, self.config, self.tracker)
 
+        # Pages built after the window is shown use this same instance, even if
+        # self.downloader has been replaced by then
+        self._page_downloader = self.downloader
+
         # Initialize scoring system with correct path
         self.scoring = ScoringSystem(get_data_path("video_scores.json"))
 
@@ -80,11 +82,27 @@ class YouTubePlaylistDownloaderApp(QWidget):
         # Side menu
         side_menu_frame = QFrame()
         side_menu_frame.setObjectName("sidebar")
+        # One sheet for the sidebar and all of its menu buttons, rather than
+        # each button parsing its own copy of the button rules
         side_menu_frame.setStyleSheet("""
             #sidebar {
                 background-color: #1e2429;
                 border-right: 1px solid #121920;
             }
+            #sidebar_button {
+                text-align: left;
+                padding-left: 15px;
+                border: none;
+                border-radius: 5px;
+                background-color: transparent;
+            }
+            #sidebar_button:hover {
+                background-color: #273341;
+            }
+            #sidebar_button:checked {
+                background-color: #2a4055;
+                font-weight: bold;
+            }
         """)
         side_menu_frame.setFixedWidth(180)
         side_menu_layout = QVBoxLayout(side_menu_frame)
@@ -128,28 +146,12 @@ class YouTubePlaylistDownloaderApp(QWidget):
             btn.setMinimumHeight(50)
             
             # Set icon if available
-            icon_path = os.path.join("gui", "icons", icon_name)
-            if os.path.exists(icon_path):
-                btn.setIcon(QIcon(icon_path))
+            icon = IconProvider.get(icon_name)
+            if icon:
+                btn.setIcon(icon)
                 btn.setIconSize(QSize(24, 24))
             
             btn.setObjectName("sidebar_button")
-            btn.setStyleSheet("""
-                #sidebar_button {
-                    text-align: left;
-                    padding-left: 15px;
-                    border: none;
-                    border-radius: 5px;
-                    background-color: transparent;
-                }
-                #sidebar_button:hover {
-                    background-color: #273341;
-                }
-                #sidebar_button:checked {
-                    background-color: #2a4055;
-                    font-weight: bold;
-                }
-            """)
             btn.setCheckable(True)
             btn.clicked.connect(lambda checked, name=name: self.change_page(name))
             side_menu_layout.addWidget(btn)
@@ -171,30 +173,40 @@ class YouTubePlaylistDownloaderApp(QWidget):
         # Stacked layout for pages
         self.stacked_layout = QStackedLayout()
         
-        # Create pages
+        # Create the start page; the others are built once the window has
+        # been shown (see _build_remaining_pages)
         self.player_page = PlayerPage(
             self.tracker, 
             self.scoring, 
             self.audio_player,
             self.downloader  # Pass the downloader instance
         )
-        self.playlists_page = PlaylistsPage(self.downloader, self.tracker)
-        self.analytics_page = AnalyticsPage()  # Use placeholder version with no parameters
-        self.settings_page = SettingsPage(self.config, self.downloader)
-        self.about_page = AboutPage()
-        
-        # Add pages to stacked layout
         self.stacked_layout.addWidget(self.player_page)
-        self.stacked_layout.addWidget(self.playlists_page)
-        self.stacked_layout.addWidget(self.analytics_page)
-        self.stacked_layout.addWidget(self.settings_page)
-        self.stacked_layout.addWidget(self.about_page)
+        self._pages_built = False
+        QTimer.singleShot(0, self._build_remaining_pages)
         
         content_layout.addLayout(self.stacked_layout)
         
         # Add components to main layout
         main_layout.addWidget(side_menu_frame)
         main_layout.addWidget(content_frame, 1)
+    
+    def _build_remaining_pages(self):
+        """Create the pages other than the player, if not done yet."""
+        if self._pages_built:
+            return
+        self._pages_built = True
+        
+        self.playlists_page = PlaylistsPage(self._page_downloader, self.tracker)
+        self.analytics_page = AnalyticsPage()  # Use placeholder version with no parameters
+        self.settings_page = SettingsPage(self.config, self._page_downloader)
+        self.about_page = AboutPage()
+        
+        # Add pages to stacked layout, after the player page
+        self.stacked_layout.addWidget(self.playlists_page)
+        self.stacked_layout.addWidget(self.analytics_page)
+        self.stacked_layout.addWidget(self.settings_page)
+        self.stacked_layout.addWidget(self.about_page)
         
         # Connect signals
         self.playlists_page.playlist_updated.connect(self.player_page.refresh_queue)
@@ -209,8 +221,10 @@ class YouTubePlaylistDownloaderApp(QWidget):
             "About": 4
         }
         
-        # Set the current page
+        # Set the current page (building it now if the user got here first)
         index = page_indices.get(page_name, 0)
+        if index:
+            self._build_remaining_pages()
         self.stacked_layout.setCurrentIndex(index)
         
         # Update button states
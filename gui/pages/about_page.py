@@ -20,6 +20,12 @@ class AboutPage(QWidget):
         """Set up the user interface."""
         layout = QVBoxLayout(self)
         
+        # Fonts shared by the labels below (QFont is implicitly shared, so
+        # each size is built once rather than per label)
+        title_font = QFont("Arial", 20, QFont.Bold)
+        heading_font = QFont("Arial", 14, QFont.Bold)
+        body_font = QFont("Arial", 11)
+        
         # App logo
         logo_layout = QHBoxLayout()
         logo_label = QLabel()
@@ -32,12 +38,12 @@ class AboutPage(QWidget):
             else:
                 # Fallback text logo
                 logo_label.setText("YouTube Playlist\nDownloader")
-                logo_label.setFont(QFont("Arial", 20, QFont.Bold))
+                logo_label.setFont(title_font)
                 logo_label.setStyleSheet("color: #2a82da;")
         except:
             # Fallback text logo
             logo_label.setText("YouTube Playlist\nDownloader")
-            logo_label.setFont(QFont("Arial", 20, QFont.Bold))
+            logo_label.setFont(title_font)
             logo_label.setStyleSheet("color: #2a82da;")
             
         logo_label.setAlignment(Qt.AlignCenter)
@@ -47,7 +53,7 @@ class AboutPage(QWidget):
         
         # App info
         title_label = QLabel("YouTube Playlist Downloader")
-        title_label.setFont(QFont("Arial", 20, QFont.Bold))
+        title_label.setFont(title_font)
         title_label.setAlignment(Qt.AlignCenter)
         
         # Try to get version
@@ -68,13 +74,13 @@ class AboutPage(QWidget):
             "It includes an audio player with intelligent queue management based on scoring algorithms."
         )
         description_label = QLabel(description)
-        description_label.setFont(QFont("Arial", 11))
+        description_label.setFont(body_font)
         description_label.setWordWrap(True)
         description_label.setAlignment(Qt.AlignCenter)
         
         # Features
         features_title = QLabel("Key Features")
-        features_title.setFont(QFont("Arial", 14, QFont.Bold))
+        features_title.setFont(heading_font)
         features_title.setAlignment(Qt.AlignCenter)
         
         features = (
@@ -87,12 +93,12 @@ class AboutPage(QWidget):
         )
         
         features_label = QLabel(features)
-        features_label.setFont(QFont("Arial", 11))
+        features_label.setFont(body_font)
         features_label.setAlignment(Qt.AlignLeft)
         
         # Legal disclaimer
         disclaimer_title = QLabel("Legal Disclaimer")
-        disclaimer_title.setFont(QFont("Arial", 14, QFont.Bold))
+        disclaimer_title.setFont(heading_font)
         disclaimer_title.setAlignment(Qt.AlignCenter)
         
         disclaimer = (
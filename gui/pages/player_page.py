@@ -1,14 +1,14 @@
 """
 Audio player page for the YouTube Playlist Downloader.
 """
-import os
 import re
+import logging
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
     QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QMenu, QAction,
     QMessageBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QSize
+from PyQt5.QtCore import Qt, pyqtSignal, QSize, QTimer
 
 from downloader.tracker import DownloadTracker
 from downloader.scoring import ScoringSystem
@@ -30,14 +30,18 @@ class PlayerPage(QWidget):
         self.audio_player = audio_player
         self.current_track = None
         
+        # Playlist names last shown in the playlists table
+        self._shown_playlists = None
+        
         # Store reference to the downloader (needed for download dialog)
         self.downloader = downloader
         
         self.init_ui()
         self.connect_signals()
         
-        # Initial refresh
-        self.refresh_queue()
+        # Initial refresh, deferred until the event loop runs so the window
+        # paints before the history is scored and the files are checked
+        QTimer.singleShot(0, self.refresh_queue)
     
     def init_ui(self):
         """Initialize the user interface."""
@@ -188,19 +192,24 @@ class PlayerPage(QWidget):
     
     def refresh_playlists(self):
         """Refresh the playlists list."""
-        self.playlists_widget.setRowCount(0)
-        
-        # Get all playlists from tracker
-        playlists = self.tracker.get_playlists()
+        # Get all playlists from tracker, plus an "Other" playlist for
+        # single videos (on a copy, so the tracker's list is left alone)
+        playlists = self.tracker.get_playlists() + [{"name": "Other", "url": "other_videos"}]
+        
+        # Every queue refresh lands here; when the playlists are the same as
+        # last time, keep the table (and the user's checked boxes) as it is
+        names = tuple(playlist["name"] for playlist in playlists)
+        if names == self._shown_playlists:
+            return
+        self._shown_playlists = names
         
-        # Add "Other" playlist for single videos
-        playlists.append({"name": "Other", "url": "other_videos"})
+        # Size the table once and fill it without repainting per row
+        self.playlists_widget.setUpdatesEnabled(False)
+        self.playlists_widget.setRowCount(0)
+        self.playlists_widget.setRowCount(len(playlists))
         
         # Add to table
-        for playlist in playlists:
-            row = self.playlists_widget.rowCount()
-            self.playlists_widget.insertRow(row)
-            
+        for row, playlist in enumerate(playlists):
             # Name column
             name_item = QTableWidgetItem(playlist["name"])
             self.playlists_widget.setItem(row, 0, name_item)
@@ -209,6 +218,8 @@ class PlayerPage(QWidget):
             checkbox_item = QTableWidgetItem()
             checkbox_item.setCheckState(Qt.Unchecked)
             self.playlists_widget.setItem(row, 1, checkbox_item)
+        
+        self.playlists_widget.setUpdatesEnabled(True)
     
     def refresh_queue(self):
         """Refresh the queue table with downloaded videos."""
@@ -220,26 +231,36 @@ class PlayerPage(QWidget):
         # Get top videos from scoring system
         top_videos = self.scoring.get_top_videos(time_slot=current_slot, limit=50)
         
-        # Clear the table
+        # Look up just the scored videos in the tracker, rather than copying
+        # the whole download history on every refresh
+        downloaded_videos = {}
+        for video in top_videos:
+            downloaded_video = self.tracker.get_downloaded_video(video["id"])
+            if downloaded_video is not None:
+                downloaded_videos[video["id"]] = downloaded_video
+        
+        # Check which audio files are still on disk, one listing per folder
+        existing_ids = self.tracker.get_existing_video_ids(list(downloaded_videos))
+        
+        # Skip videos that are not downloaded or whose file has gone missing
+        entries = [(index, video) for index, video in enumerate(top_videos)
+                   if video["id"] in existing_ids]
+        
+        # Clear the table, size it once and fill it without repainting per row
+        self.queue_table.setUpdatesEnabled(False)
         self.queue_table.clearContents()
         self.queue_table.setRowCount(0)
+        self.queue_table.setRowCount(len(entries))
         
-        # Get downloaded videos from tracker to match with scored videos
-        downloaded_videos = {video["id"]: video for video in self.tracker.get_downloaded_videos()}
+        # Most videos share a handful of playlist combinations, so each
+        # combination's label is joined once and reused for later rows
+        playlist_labels = {}
         
         # Add to table
-        for index, video in enumerate(top_videos):
+        for row, (index, video) in enumerate(entries):
             video_id = video["id"]
-            
-            # Skip if not in downloaded videos
-            if video_id not in downloaded_videos:
-                continue
-            
             downloaded_video = downloaded_videos[video_id]
             
-            row = self.queue_table.rowCount()
-            self.queue_table.insertRow(row)
-            
             # Number column
             number_item = QTableWidgetItem(str(index + 1))
             number_item.setTextAlignment(Qt.AlignCenter)
@@ -253,8 +274,10 @@ class PlayerPage(QWidget):
             # Playlist column
             playlist_info = ""
             if "playlist_info" in downloaded_video:
-                playlist_names = [p["name"] for p in downloaded_video["playlist_info"]]
-                playlist_info = ", ".join(playlist_names)
+                playlist_names = tuple(p["name"] for p in downloaded_video["playlist_info"])
+                playlist_info = playlist_labels.get(playlist_names)
+                if playlist_info is None:
+                    playlist_info = playlist_labels[playlist_names] = ", ".join(playlist_names)
             self.queue_table.setItem(row, 2, QTableWidgetItem(playlist_info))
             
             # Duration column
@@ -268,7 +291,9 @@ class PlayerPage(QWidget):
             # Score column
             score_item = QTableWidgetItem(f"{video['score']:.1f}")
             score_item.setTextAlignment(Qt.AlignCenter)
-            self.queue_table.setItem(row, 4, QTableWidgetItem(score_item))
+            self.queue_table.setItem(row, 4, score_item)
+        
+        self.queue_table.setUpdatesEnabled(True)
     
     def download_clicked(self):
         """Handle download button click."""
@@ -342,6 +367,12 @@ class PlayerPage(QWidget):
         selected_playlists = []
         selected_urls = []
         
+        # Map playlist names to URLs once (first match wins, as before)
+        # instead of scanning the tracker's playlists for every checked row
+        urls_by_name = {}
+        for playlist in self.tracker.get_playlists():
+            urls_by_name.setdefault(playlist["name"], playlist["url"])
+        
         # Get all checked playlists
         for row in range(self.playlists_widget.rowCount()):
             checkbox_item = self.playlists_widget.item(row, 1)
@@ -350,10 +381,8 @@ class PlayerPage(QWidget):
                 selected_playlists.append(playlist_name)
                 
                 # Get URL for this playlist from tracker
-                for playlist in self.tracker.get_playlists():
-                    if playlist["name"] == playlist_name:
-                        selected_urls.append(playlist["url"])
-                        break
+                if playlist_name in urls_by_name:
+                    selected_urls.append(urls_by_name[playlist_name])
         
         if not selected_playlists:
             QMessageBox.warning(self, "Selection Error", "Please select at least one playlist to update.")
@@ -383,34 +412,38 @@ class PlayerPage(QWidget):
             download_dialog.start_download(url, name)
             download_dialog.exec_()
     
-    def play_track(self, row):
-        """Play the track at the specified row."""
+    def play_track(self, row, show_errors=True):
+        """
+        Play the track at the specified row.
+        
+        Args:
+            row: Row of the track in the queue table
+            show_errors: Whether to show a message box if the file is missing
+            
+        Returns:
+            True if playback started, False otherwise
+        """
         title_item = self.queue_table.item(row, 1)
         if not title_item:
-            return
+            return False
         
         video_id = title_item.data(Qt.UserRole)
         title = title_item.text()
         
-        # Get file path from tracker
-        downloaded_videos = self.tracker.get_downloaded_videos()
-        file_path = None
-        
-        for video in downloaded_videos:
-            if video["id"] == video_id:
-                file_path = video["file_path"]
-                break
+        # Get file path from tracker; load() checks the file exists, so it
+        # is not stat'ed a second time here
+        file_path = self.tracker.get_video_file_path(video_id)
         
-        if not file_path or not os.path.exists(file_path):
-            QMessageBox.warning(self, "Playback Error", f"Could not find audio file for: {title}")
-            return
+        if not file_path or not self.audio_player.load(file_path, video_id):
+            if show_errors:
+                QMessageBox.warning(self, "Playback Error", f"Could not find audio file for: {title}")
+            return False
         
         # Update current track and highlight in table
         self.current_track = {"id": video_id, "title": title, "row": row}
         self.queue_table.selectRow(row)
         
         # Start playback
-        self.audio_player.load(file_path, video_id)
         self.audio_player.play()
         
         # Update UI
@@ -418,18 +451,23 @@ class PlayerPage(QWidget):
         
         # Emit signal
         self.track_played.emit(video_id)
+        return True
     
     def play_next(self):
-        """Play the next track in the queue."""
-        if self.current_track is None:
-            # If no track is playing, play the first one
-            if self.queue_table.rowCount() > 0:
-                self.play_track(0)
-            return
-        
-        next_row = self.current_track["row"] + 1
-        if next_row < self.queue_table.rowCount():
-            self.play_track(next_row)
+        """
+        Play the next playable track in the queue.
+        
+        Tracks whose file has gone missing are skipped in a single pass, so
+        playback carries on after the current track ends instead of stopping
+        at a message box.
+        """
+        # If no track is playing, start from the first one
+        first_row = 0 if self.current_track is None else self.current_track["row"] + 1
+        
+        for row in range(first_row, self.queue_table.rowCount()):
+            if self.play_track(row, show_errors=False):
+                return
+            logging.warning(f"Skipping unplayable track at queue row {row + 1}")
     
     def play_previous(self):
         """Play the previous track in the queue."""
@@ -4,8 +4,10 @@ Playlist management page for the YouTube Playlist Downloader.
 import os
 import re
 import logging
+import functools
+import threading
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, 
@@ -13,12 +15,52 @@ from PyQt5.QtWidgets import (
     QTableWidget, QTableWidgetItem, QHeaderView, 
     QMessageBox, QAbstractItemView, QProgressDialog
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QThread
+from PyQt5.QtCore import Qt, pyqtSignal, QThread, QTimer
 from PyQt5.QtGui import QFont
 
-from downloader.youtube import YouTubeDownloader
 from downloader.tracker import DownloadTracker
 
+if TYPE_CHECKING:
+    # Only needed for annotations; avoids pulling in yt-dlp at import time
+    from downloader.youtube import YouTubeDownloader
+
+# Rows added to the playlists table per event loop pass
+FILL_CHUNK_ROWS = 50
+
+# YouTube host at the start of a URL (scheme optional), and a list= parameter
+_YT_RE = re.compile(r'^(?:https?://)?(?:www\.|m\.|music\.)?(youtube\.com|youtu\.be)/')
+_PLAYLIST_RE = re.compile(r'[?&]list=')
+
+def _is_yt_playlist(url: str) -> bool:
+    """Check whether a URL is on a YouTube host and names a playlist."""
+    return bool(_YT_RE.match(url) and _PLAYLIST_RE.search(url))
+
+def _is_yt_video(url: str) -> bool:
+    """Check whether a URL is a YouTube watch or youtu.be link."""
+    match = _YT_RE.match(url)
+    if not match:
+        return False
+    return match.group(1) == "youtu.be" or url.startswith("watch", match.end())
+
+@functools.lru_cache(maxsize=256)
+def _format_last_checked(value: str) -> str:
+    """
+    Format a playlist's ISO last-checked timestamp for display.
+    
+    The timestamps only change when a playlist is checked, so repeated table
+    reloads hit the cache instead of parsing every row again.
+    
+    Args:
+        value: ISO format timestamp
+        
+    Returns:
+        "YYYY-MM-DD HH:MM", or the value unchanged if it cannot be parsed
+    """
+    try:
+        return datetime.fromisoformat(value).strftime("%Y-%m-%d %H:%M")
+    except (TypeError, ValueError):
+        return value
+
 class WorkerThread(QThread):
     """Background worker thread for downloads."""
     progress_signal = pyqtSignal(int, str)
@@ -36,7 +78,8 @@ class WorkerThread(QThread):
             if self.operation_type == "playlist":
                 # Get playlist videos
                 self.progress_signal.emit(10, "Loading playlist info...")
-                videos = self.downloader.get_playlist_videos(self.url)
+                # Titles and URLs are enough; each download fetches its own info
+                videos = self.downloader.get_playlist_videos(self.url, detailed=False)
                 
                 if not videos:
                     self.finished_signal.emit(False, "No videos found in playlist", 0, 0)
@@ -86,7 +129,10 @@ class PlaylistsPage(QWidget):
     # Signal emitted when a playlist is updated
     playlist_updated = pyqtSignal()
     
-    def __init__(self, downloader: YouTubeDownloader, tracker: DownloadTracker):
+    # Emitted from the counting thread: (fill generation, URL -> video count)
+    video_counts_ready = pyqtSignal(int, dict)
+    
+    def __init__(self, downloader: "YouTubeDownloader", tracker: DownloadTracker):
         """
         Initialize the playlists page.
         
@@ -101,6 +147,15 @@ class PlaylistsPage(QWidget):
         # Current download operation
         self.download_thread = None
         self.progress_dialog = None
+        # Latest (value, message) not yet shown; see update_progress
+        self._pending_progress = None
+        
+        # Bumped by load_playlists so an older chunked fill stops early
+        self._fill_generation = 0
+        
+        # Playlist URL -> downloaded video count, None until counted
+        self._video_counts = None
+        self.video_counts_ready.connect(self._apply_video_counts)
         
         # Set up UI
         self.setup_ui()
@@ -221,60 +276,27 @@ class PlaylistsPage(QWidget):
         
     def load_playlists(self):
         """Load playlists into the table."""
+        # Any fill still in progress from an earlier call is abandoned
+        self._fill_generation += 1
+        
         try:
-            # Clear the table
+            # Copy the list since rows are filled across several event loop passes
+            playlists = list(self.tracker.get_playlists())
+            
+            # Clear the table and size it once
             self.playlists_table.setRowCount(0)
+            self.playlists_table.setRowCount(len(playlists))
             
-            # Get playlists
-            playlists = self.tracker.get_playlists()
-            
-            for playlist in playlists:
-                row = self.playlists_table.rowCount()
-                self.playlists_table.insertRow(row)
-                
-                # Set name
-                name = playlist.get('name', 'Unknown')
-                self.playlists_table.setItem(row, 0, QTableWidgetItem(name))
-                
-                # Set URL
-                url = playlist.get('url', '')
-                url_item = QTableWidgetItem(url)
-                # Store full URL as data
-                url_item.setData(Qt.UserRole, url)
-                self.playlists_table.setItem(row, 1, url_item)
-                
-                # Set video count (placeholder)
-                video_count = "0"  # We'll need to calculate this
-                self.playlists_table.setItem(row, 2, QTableWidgetItem(video_count))
-                
-                # Set last updated
-                last_checked = playlist.get('last_checked', 'Never')
-                if last_checked and last_checked != 'Never':
-                    try:
-                        dt = datetime.fromisoformat(last_checked)
-                        last_checked = dt.strftime("%Y-%m-%d %H:%M")
-                    except:
-                        pass
-                        
-                self.playlists_table.setItem(row, 3, QTableWidgetItem(last_checked))
-                
-                # Add action buttons
-                actions_widget = QWidget()
-                actions_layout = QHBoxLayout(actions_widget)
-                actions_layout.setContentsMargins(0, 0, 0, 0)
-                
-                update_button = QPushButton("Update")
-                update_button.setProperty("url", url)
-                update_button.clicked.connect(self.update_playlist)
-                
-                remove_button = QPushButton("Remove")
-                remove_button.setProperty("url", url)
-                remove_button.clicked.connect(self.remove_playlist)
-                
-                actions_layout.addWidget(update_button)
-                actions_layout.addWidget(remove_button)
-                
-                self.playlists_table.setCellWidget(row, 4, actions_widget)
+            # Video counts need a scan of the download folders, so they are
+            # filled in by a background thread once the rows are up
+            self._video_counts = None
+            self._fill_playlist_rows(self._fill_generation, playlists, 0)
+            threading.Thread(
+                target=self._count_videos,
+                args=(self._fill_generation,),
+                name="playlist-video-count",
+                daemon=True,
+            ).start()
             
             logging.info(f"Loaded {len(playlists)} playlists")
             
@@ -282,6 +304,124 @@ class PlaylistsPage(QWidget):
             logging.error(f"Error loading playlists: {str(e)}")
             QMessageBox.warning(self, "Error", f"Failed to load playlists: {str(e)}")
     
+    def _fill_playlist_rows(self, generation, playlists, start):
+        """
+        Fill one chunk of playlist rows and schedule the next.
+        
+        Building the per-row action buttons is the slow part, so rows are
+        added FILL_CHUNK_ROWS at a time with the event loop running in between.
+        
+        Args:
+            generation: Value of _fill_generation when the fill started
+            playlists: Playlists being shown
+            start: Index of the first row in this chunk
+        """
+        if generation != self._fill_generation:
+            # load_playlists was called again; that fill owns the table now
+            return
+        
+        end = min(start + FILL_CHUNK_ROWS, len(playlists))
+        
+        # Fill the chunk without repainting after every row
+        self.playlists_table.setUpdatesEnabled(False)
+        try:
+            for row in range(start, end):
+                self._set_playlist_row(row, playlists[row])
+        except Exception as e:
+            logging.error(f"Error loading playlists: {str(e)}")
+            QMessageBox.warning(self, "Error", f"Failed to load playlists: {str(e)}")
+            return
+        finally:
+            self.playlists_table.setUpdatesEnabled(True)
+        
+        if end < len(playlists):
+            QTimer.singleShot(0, functools.partial(
+                self._fill_playlist_rows, generation, playlists, end))
+    
+    def _set_playlist_row(self, row, playlist):
+        """Populate a single row of the playlists table."""
+        # Set name
+        name = playlist.get('name', 'Unknown')
+        self.playlists_table.setItem(row, 0, QTableWidgetItem(name))
+        
+        # Set URL
+        url = playlist.get('url', '')
+        url_item = QTableWidgetItem(url)
+        # Store full URL as data
+        url_item.setData(Qt.UserRole, url)
+        self.playlists_table.setItem(row, 1, url_item)
+        
+        # Set video count (downloaded files still on disk), if counted yet
+        self.playlists_table.setItem(row, 2, QTableWidgetItem(self._video_count_text(url)))
+        
+        # Set last updated
+        last_checked = playlist.get('last_checked', 'Never')
+        if last_checked and last_checked != 'Never':
+            last_checked = _format_last_checked(last_checked)
+                
+        self.playlists_table.setItem(row, 3, QTableWidgetItem(last_checked))
+        
+        # Add action buttons
+        actions_widget = QWidget()
+        actions_layout = QHBoxLayout(actions_widget)
+        actions_layout.setContentsMargins(0, 0, 0, 0)
+        
+        update_button = QPushButton("Update")
+        update_button.setProperty("url", url)
+        update_button.clicked.connect(self.update_playlist)
+        
+        remove_button = QPushButton("Remove")
+        remove_button.setProperty("url", url)
+        remove_button.clicked.connect(self.remove_playlist)
+        
+        actions_layout.addWidget(update_button)
+        actions_layout.addWidget(remove_button)
+        
+        self.playlists_table.setCellWidget(row, 4, actions_widget)
+    
+    def _video_count_text(self, url):
+        """Get the text for a playlist's video count cell."""
+        if self._video_counts is None:
+            return "..."
+        return str(self._video_counts.get(url, 0))
+    
+    def _count_videos(self, generation):
+        """
+        Count each playlist's downloaded videos (runs on a background thread).
+        
+        Args:
+            generation: Value of _fill_generation when the count started
+        """
+        try:
+            counts = self.tracker.get_playlist_video_counts()
+        except Exception as e:
+            logging.error(f"Error counting playlist videos: {str(e)}")
+            return
+        
+        # Queued to the GUI thread, since the page lives there
+        self.video_counts_ready.emit(generation, counts)
+    
+    def _apply_video_counts(self, generation, counts):
+        """
+        Show video counts from the counting thread.
+        
+        Args:
+            generation: Value of _fill_generation when the count started
+            counts: Playlist URL -> downloaded video count
+        """
+        if generation != self._fill_generation:
+            # The table was reloaded since; its own count is on the way
+            return
+        
+        self._video_counts = counts
+        
+        # Rows not filled yet pick the counts up in _set_playlist_row
+        for row in range(self.playlists_table.rowCount()):
+            url_item = self.playlists_table.item(row, 1)
+            count_item = self.playlists_table.item(row, 2)
+            if url_item is not None and count_item is not None:
+                count_item.setText(self._video_count_text(url_item.data(Qt.UserRole)))
+    
     def add_playlist(self):
         """Add a new playlist to track."""
         url = self.url_input.text().strip()
@@ -297,8 +437,8 @@ class PlaylistsPage(QWidget):
             return
             
         try:
-            # Validate URL is a YouTube playlist
-            if "youtube.com/playlist" not in url and "list=" not in url:
+            # Validate URL is a YouTube playlist (a watch URL with list= counts)
+            if not _is_yt_playlist(url):
                 QMessageBox.warning(self, "Error", "This doesn't appear to be a valid YouTube playlist URL")
                 return
             
@@ -350,11 +490,8 @@ class PlaylistsPage(QWidget):
             return
             
         # Find the playlist name
-        playlist_name = None
-        for playlist in self.tracker.get_playlists():
-            if playlist["url"] == url:
-                playlist_name = playlist.get("name", "Unknown")
-                break
+        playlist = self.tracker.get_playlist(url)
+        playlist_name = playlist.get("name", "Unknown") if playlist else None
                 
         # Confirm the update
         confirm = QMessageBox.question(
@@ -396,12 +533,27 @@ class PlaylistsPage(QWidget):
     
     def update_progress(self, value, message):
         """Update progress dialog."""
+        # A modal QProgressDialog runs processEvents() inside setValue(), so
+        # keep only the latest update and apply it on the next event loop pass
+        scheduled = self._pending_progress is not None
+        self._pending_progress = (value, message)
+        if not scheduled:
+            QTimer.singleShot(0, self._apply_progress)
+    
+    def _apply_progress(self):
+        """Show the most recent queued progress update."""
+        if self._pending_progress is None:
+            return
+        value, message = self._pending_progress
+        self._pending_progress = None
+        
         if self.progress_dialog:
-            self.progress_dialog.setValue(value)
             self.progress_dialog.setLabelText(message)
+            self.progress_dialog.setValue(value)
     
     def download_finished(self, success, message, successful_count, failed_count):
         """Handle download completion."""
+        self._pending_progress = None
         if self.progress_dialog:
             self.progress_dialog.setValue(100)
             self.progress_dialog.close()
@@ -430,11 +582,8 @@ class PlaylistsPage(QWidget):
             return
             
         # Find the playlist name
-        playlist_name = None
-        for playlist in self.tracker.get_playlists():
-            if playlist["url"] == url:
-                playlist_name = playlist.get("name", "Unknown")
-                break
+        playlist = self.tracker.get_playlist(url)
+        playlist_name = playlist.get("name", "Unknown") if playlist else None
         
         # Confirm deletion
         confirm = QMessageBox.question(
@@ -490,7 +639,7 @@ class PlaylistsPage(QWidget):
             
         try:
             # Validate URL is a YouTube video
-            if "youtube.com/watch" not in url and "youtu.be/" not in url:
+            if not _is_yt_video(url):
                 QMessageBox.warning(self, "Error", "This doesn't appear to be a valid YouTube video URL")
                 return
             
@@ -516,6 +665,7 @@ class PlaylistsPage(QWidget):
     
     def direct_download_finished(self, success, message, successful_count, failed_count):
         """Handle direct download completion."""
+        self._pending_progress = None
         if self.progress_dialog:
             self.progress_dialog.setValue(100)
             self.progress_dialog.close()
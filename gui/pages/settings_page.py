@@ -1,24 +1,238 @@
 """Settings page for the YouTube Playlist Downloader."""
 import os
+import logging
+import functools
+import configparser
+from typing import TYPE_CHECKING
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QTabWidget, QGroupBox, QLabel, QLineEdit, 
     QPushButton, QSpinBox, QDoubleSpinBox, QComboBox, QCheckBox,
     QHBoxLayout, QFormLayout, QFileDialog, QMessageBox, QFrame
 )
-from PyQt5.QtCore import pyqtSignal, Qt, QSize
-from PyQt5.QtGui import QFont, QIcon
+from PyQt5.QtCore import pyqtSignal, Qt, QSize, QTimer
+from PyQt5.QtGui import QFont
 
 from data.config_manager import ConfigHandler
-from downloader.youtube import YouTubeDownloader
+from gui.utils.icon_provider import IconProvider
+
+if TYPE_CHECKING:
+    # Only needed for annotations; avoids pulling in yt-dlp at import time
+    from downloader.youtube import YouTubeDownloader
+
+# Combo box choices
+_STARTUP_PAGES = ("Audio Player", "Playlists", "Analytics", "Settings", "About")
+_AUDIO_FORMATS = ("mp3", "m4a", "ogg", "wav", "flac")
+_BITRATES = ("64k", "128k", "192k", "256k", "320k")
+_DEFAULT_PLAYLISTS = ("Latest", "Top Rated", "Random", "Custom")
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+
+def _parse_bool(value):
+    """Parse a raw config string as a bool using configparser's rules."""
+    if isinstance(value, bool):
+        return value
+    try:
+        return configparser.ConfigParser.BOOLEAN_STATES[str(value).strip().lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value!r}") from None
+
+
+# Parsers for number and check box settings; a value they reject loads the default
+_KIND_PARSE = {
+    "int": int,
+    "float": float,
+    "bool": _parse_bool,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _home():
+    """Return the user's home directory (resolved once)."""
+    return os.path.expanduser("~")
+
+
+def _spin(rng, tip, suffix="", step=None, decimals=None, double=False):
+    """Create a configured QSpinBox (or QDoubleSpinBox when double is set)."""
+    widget = QDoubleSpinBox() if double else QSpinBox()
+    widget.setRange(*rng)
+    if decimals is not None:
+        widget.setDecimals(decimals)
+    if step is not None:
+        widget.setSingleStep(step)
+    if suffix:
+        widget.setSuffix(suffix)
+    widget.setToolTip(tip)
+    return widget
+
+
+def _combo(items, tip):
+    """Create a QComboBox with the given items and tooltip."""
+    widget = QComboBox()
+    widget.addItems(items)
+    widget.setToolTip(tip)
+    return widget
+
+
+def _check(tip, text=""):
+    """Create a QCheckBox with the given tooltip."""
+    widget = QCheckBox(text)
+    widget.setToolTip(tip)
+    return widget
+
+
+def _browse_button(slot):
+    """Create a fixed-width "Browse..." button wired to slot."""
+    button = QPushButton("Browse...")
+    button.setFixedWidth(100)
+    button.clicked.connect(slot)
+    return button
+
+
+def _form_group(title, rows):
+    """Create a QGroupBox with a QFormLayout populated from (label, field) rows."""
+    group = QGroupBox(title)
+    form = QFormLayout(group)
+    for label, field in rows:
+        form.addRow(label, field)
+    return group
+
+
+def _info_frame(text):
+    """Create the styled info box used below settings groups."""
+    info_frame = QFrame()
+    info_frame.setObjectName("info_frame")
+    info_layout = QVBoxLayout(info_frame)
+    
+    info_label = QLabel(text)
+    info_label.setObjectName("info_text")
+    info_label.setWordWrap(True)
+    
+    info_layout.addWidget(info_label)
+    return info_frame
+
+
+# Style sheet for the whole page, set once on SettingsPage; widgets pick up
+# their rules by object name instead of each parsing a sheet of their own
+_PAGE_STYLE = """
+    QTabWidget::pane {
+        border: 1px solid #1a2129;
+        background-color: #121920;
+        border-radius: 5px;
+    }
+    QTabBar::tab {
+        background-color: #1a2129;
+        color: white;
+        padding: 8px 20px;
+        border-top-left-radius: 5px;
+        border-top-right-radius: 5px;
+        margin-right: 2px;
+    }
+    QTabBar::tab:selected {
+        background-color: #2a82da;
+    }
+    QTabBar::tab:hover:!selected {
+        background-color: #2a4055;
+    }
+    #info_frame {
+        background-color: #1a2129;
+        border-radius: 5px;
+        padding: 10px;
+    }
+    #info_text {
+        color: #cccccc;
+    }
+    #warning_label {
+        color: #cc3300;
+    }
+    QPushButton#reset_button {
+        background-color: #2a4055;
+        color: white;
+        border-radius: 5px;
+        padding: 8px 15px;
+    }
+    QPushButton#reset_button:hover {
+        background-color: #3a5065;
+    }
+    QPushButton#reset_button:pressed {
+        background-color: #1a3045;
+    }
+    QPushButton#save_button {
+        background-color: #2a82da;
+        color: white;
+        border-radius: 5px;
+        padding: 8px 15px;
+    }
+    QPushButton#save_button:hover {
+        background-color: #3a92ea;
+    }
+    QPushButton#save_button:pressed {
+        background-color: #1a72ca;
+    }
+"""
+
+
+# Widget <-> config marshaling per widget kind
+_KIND_LOAD = {
+    "text": lambda w, v: w.setText(str(v)),
+    "int": lambda w, v: w.setValue(int(v)),
+    "float": lambda w, v: w.setValue(float(v)),
+    "bool": lambda w, v: w.setChecked(bool(v)),
+    "combo": lambda w, v: w.setCurrentText(str(v)),
+}
+_KIND_SAVE = {
+    "text": lambda w: w.text(),
+    "int": lambda w: str(w.value()),
+    "float": lambda w: str(w.value()),
+    "bool": lambda w: str(w.isChecked()),
+    "combo": lambda w: w.currentText(),
+}
+
 
 class SettingsPage(QWidget):
     """Settings management page."""
     settings_saved = pyqtSignal()
     
-    def __init__(self, config: ConfigHandler, downloader: YouTubeDownloader):
+    # (section, option, widget attribute, kind, default)
+    _SCHEMA = (
+        # General settings
+        ("general", "output_directory", "output_dir_input", "text", "data/audio"),
+        ("general", "check_interval", "check_interval_spin", "int", 24),
+        ("general", "max_downloads", "max_downloads_spin", "int", 10),
+        # UI settings
+        ("ui", "dark_theme", "dark_theme_check", "bool", True),
+        ("ui", "startup_page", "startup_page_combo", "combo", "Audio Player"),
+        # Audio settings
+        ("audio", "format", "audio_format_combo", "combo", "mp3"),
+        ("audio", "bitrate", "audio_bitrate_combo", "combo", "192k"),
+        ("audio", "normalize_audio", "normalize_audio_check", "bool", False),
+        ("audio", "target_level", "target_level_spin", "float", -18.0),
+        # Player settings
+        ("player", "default_playlist", "default_playlist_combo", "combo", "Latest"),
+        ("player", "auto_normalize", "auto_normalize_check", "bool", False),
+        ("player", "crossfade", "crossfade_check", "bool", False),
+        ("player", "crossfade_duration", "crossfade_spin", "float", 2.0),
+        ("player", "keep_history", "keep_history_check", "bool", True),
+        ("player", "history_limit", "history_limit_spin", "int", 100),
+        # Scoring settings
+        ("scoring", "enable_scoring", "enable_scoring_check", "bool", True),
+        ("scoring", "score_decay", "score_decay_spin", "float", 0.9),
+        ("scoring", "new_content_boost", "new_content_boost_spin", "float", 1.5),
+        ("scoring", "time_effect_strength", "time_effect_spin", "float", 1.0),
+        # Logging settings
+        ("logging", "level", "log_level_combo", "combo", "INFO"),
+        ("logging", "console", "console_logging_check", "bool", True),
+        ("logging", "file_logging", "log_file_check", "bool", False),
+        ("logging", "file", "log_file_input", "text", "logs/app.log"),
+        # Advanced settings
+        ("advanced", "concurrent_downloads", "concurrent_downloads_spin", "int", 1),
+        ("advanced", "ffmpeg_path", "ffmpeg_path_input", "text", ""),
+    )
+    
+    def __init__(self, config: ConfigHandler, downloader: "YouTubeDownloader"):
         super().__init__()
         self.config = config
         self.downloader = downloader
+        self._reset_overlay = None
         
         # Initialize UI
         self.init_ui()
@@ -28,31 +242,11 @@ class SettingsPage(QWidget):
     
     def init_ui(self):
         """Initialize user interface."""
+        self.setStyleSheet(_PAGE_STYLE)
         main_layout = QVBoxLayout(self)
         
         # Create tabs
         self.tabs = QTabWidget()
-        self.tabs.setStyleSheet("""
-            QTabWidget::pane {
-                border: 1px solid #1a2129;
-                background-color: #121920;
-                border-radius: 5px;
-            }
-            QTabBar::tab {
-                background-color: #1a2129;
-                color: white;
-                padding: 8px 20px;
-                border-top-left-radius: 5px;
-                border-top-right-radius: 5px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: #2a82da;
-            }
-            QTabBar::tab:hover:!selected {
-                background-color: #2a4055;
-            }
-        """)
         
         # Create tab pages
         general_tab = self.create_general_tab()
@@ -72,47 +266,21 @@ class SettingsPage(QWidget):
         buttons_layout = QHBoxLayout()
         
         self.reset_button = QPushButton("Reset to Defaults")
-        self.reset_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2a4055;
-                color: white;
-                border-radius: 5px;
-                padding: 8px 15px;
-            }
-            QPushButton:hover {
-                background-color: #3a5065;
-            }
-            QPushButton:pressed {
-                background-color: #1a3045;
-            }
-        """)
+        self.reset_button.setObjectName("reset_button")
         
         # Set icon if available
-        icon_path = os.path.join("gui", "icons", "refresh.svg")
-        if os.path.exists(icon_path):
-            self.reset_button.setIcon(QIcon(icon_path))
+        icon = IconProvider.get("refresh.svg")
+        if icon:
+            self.reset_button.setIcon(icon)
             self.reset_button.setIconSize(QSize(16, 16))
         
         self.save_button = QPushButton("Save Settings")
-        self.save_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2a82da;
-                color: white;
-                border-radius: 5px;
-                padding: 8px 15px;
-            }
-            QPushButton:hover {
-                background-color: #3a92ea;
-            }
-            QPushButton:pressed {
-                background-color: #1a72ca;
-            }
-        """)
+        self.save_button.setObjectName("save_button")
         
         # Set icon if available (could use a save icon if you have one)
-        icon_path = os.path.join("gui", "icons", "download.svg")  # Using download as a substitute for save
-        if os.path.exists(icon_path):
-            self.save_button.setIcon(QIcon(icon_path))
+        icon = IconProvider.get("download.svg")  # Using download as a substitute for save
+        if icon:
+            self.save_button.setIcon(icon)
             self.save_button.setIconSize(QSize(16, 16))
         
         buttons_layout.addWidget(self.reset_button)
@@ -140,43 +308,28 @@ class SettingsPage(QWidget):
         self.output_dir_input.setPlaceholderText("Path to save downloaded files")
         self.output_dir_input.setReadOnly(True)
         
-        browse_button = QPushButton("Browse...")
-        browse_button.setFixedWidth(100)
-        browse_button.clicked.connect(self.browse_output_directory)
-        
         output_layout.addWidget(self.output_dir_input)
-        output_layout.addWidget(browse_button)
+        output_layout.addWidget(_browse_button(self.browse_output_directory))
         
         # Download Settings Group
-        download_group = QGroupBox("Download Settings")
-        download_layout = QFormLayout(download_group)
+        self.check_interval_spin = _spin((1, 168), "How often to check for new videos in tracked playlists",
+                                         suffix=" hours")  # 1 hour to 7 days
+        self.max_downloads_spin = _spin((1, 100), "Maximum number of videos to download at once")
         
-        self.check_interval_spin = QSpinBox()
-        self.check_interval_spin.setRange(1, 168)  # 1 hour to 7 days
-        self.check_interval_spin.setSuffix(" hours")
-        self.check_interval_spin.setToolTip("How often to check for new videos in tracked playlists")
-        
-        self.max_downloads_spin = QSpinBox()
-        self.max_downloads_spin.setRange(1, 100)
-        self.max_downloads_spin.setToolTip("Maximum number of videos to download at once")
-        
-        download_layout.addRow("Check Interval:", self.check_interval_spin)
-        download_layout.addRow("Max Downloads:", self.max_downloads_spin)
+        download_group = _form_group("Download Settings", (
+            ("Check Interval:", self.check_interval_spin),
+            ("Max Downloads:", self.max_downloads_spin),
+        ))
         
         # User Interface Group
-        ui_group = QGroupBox("User Interface")
-        ui_layout = QFormLayout(ui_group)
-        
-        self.dark_theme_check = QCheckBox("Use Dark Theme")
-        self.dark_theme_check.setToolTip("Enable dark theme for the application")
+        self.dark_theme_check = _check("Enable dark theme for the application", "Use Dark Theme")
         self.dark_theme_check.setChecked(True)  # Default to dark theme
+        self.startup_page_combo = _combo(_STARTUP_PAGES, "The page to show when the application starts")
         
-        self.startup_page_combo = QComboBox()
-        self.startup_page_combo.addItems(["Audio Player", "Playlists", "Analytics", "Settings", "About"])
-        self.startup_page_combo.setToolTip("The page to show when the application starts")
-        
-        ui_layout.addRow("", self.dark_theme_check)
-        ui_layout.addRow("Startup Page:", self.startup_page_combo)
+        ui_group = _form_group("User Interface", (
+            ("", self.dark_theme_check),
+            ("Startup Page:", self.startup_page_combo),
+        ))
         
         # Add groups to layout
         layout.addWidget(output_group)
@@ -192,51 +345,27 @@ class SettingsPage(QWidget):
         layout = QVBoxLayout(tab)
         
         # Audio Format Group
-        format_group = QGroupBox("Audio Format")
-        format_layout = QFormLayout(format_group)
-        
-        self.audio_format_combo = QComboBox()
-        self.audio_format_combo.addItems(["mp3", "m4a", "ogg", "wav", "flac"])
-        self.audio_format_combo.setToolTip("Format to use for downloaded audio files")
-        
-        self.audio_bitrate_combo = QComboBox()
-        self.audio_bitrate_combo.addItems(["64k", "128k", "192k", "256k", "320k"])
+        self.audio_format_combo = _combo(_AUDIO_FORMATS, "Format to use for downloaded audio files")
+        self.audio_bitrate_combo = _combo(_BITRATES, "Bitrate for downloaded audio files")
         self.audio_bitrate_combo.setCurrentText("192k")  # Default to 192k
-        self.audio_bitrate_combo.setToolTip("Bitrate for downloaded audio files")
         
-        format_layout.addRow("Format:", self.audio_format_combo)
-        format_layout.addRow("Bitrate:", self.audio_bitrate_combo)
+        format_group = _form_group("Audio Format", (
+            ("Format:", self.audio_format_combo),
+            ("Bitrate:", self.audio_bitrate_combo),
+        ))
         
         # Audio Processing Group
-        processing_group = QGroupBox("Audio Processing")
-        processing_layout = QFormLayout(processing_group)
+        self.normalize_audio_check = _check("Normalize audio levels for consistent volume")
+        self.target_level_spin = _spin((-30.0, -1.0), "Target level for audio normalization",
+                                       suffix=" dB", step=0.5, decimals=1, double=True)
         
-        self.normalize_audio_check = QCheckBox()
-        self.normalize_audio_check.setToolTip("Normalize audio levels for consistent volume")
-        
-        self.target_level_spin = QDoubleSpinBox()
-        self.target_level_spin.setRange(-30.0, -1.0)
-        self.target_level_spin.setDecimals(1)
-        self.target_level_spin.setSingleStep(0.5)
-        self.target_level_spin.setSuffix(" dB")
-        self.target_level_spin.setToolTip("Target level for audio normalization")
-        
-        processing_layout.addRow("Normalize Audio:", self.normalize_audio_check)
-        processing_layout.addRow("Target Level:", self.target_level_spin)
+        processing_group = _form_group("Audio Processing", (
+            ("Normalize Audio:", self.normalize_audio_check),
+            ("Target Level:", self.target_level_spin),
+        ))
         
         # Add info box about normalization
-        info_frame = QFrame()
-        info_frame.setObjectName("info_frame")
-        info_frame.setStyleSheet("""
-            #info_frame {
-                background-color: #1a2129;
-                border-radius: 5px;
-                padding: 10px;
-            }
-        """)
-        info_layout = QVBoxLayout(info_frame)
-        
-        info_text = (
+        info_frame = _info_frame(
             "<b>Audio Normalization</b><br><br>"
             "Normalizing audio adjusts the volume levels to make all tracks play at a similar volume. "
             "This is useful for playlists where some tracks might be louder than others.<br><br>"
@@ -244,12 +373,6 @@ class SettingsPage(QWidget):
             "Lower values (e.g., -18 dB) will be quieter but have more headroom."
         )
         
-        info_label = QLabel(info_text)
-        info_label.setWordWrap(True)
-        info_label.setStyleSheet("color: #cccccc;")
-        
-        info_layout.addWidget(info_label)
-        
         # Add groups to layout
         layout.addWidget(format_group)
         layout.addWidget(processing_group)
@@ -264,51 +387,34 @@ class SettingsPage(QWidget):
         layout = QVBoxLayout(tab)
         
         # Playback Settings Group
-        playback_group = QGroupBox("Playback Settings")
-        playback_layout = QFormLayout(playback_group)
-        
-        self.default_playlist_combo = QComboBox()
-        self.default_playlist_combo.addItems(["Latest", "Top Rated", "Random", "Custom"])
-        self.default_playlist_combo.setToolTip("Default queue to load when the player starts")
-        
-        self.auto_normalize_check = QCheckBox()
-        self.auto_normalize_check.setToolTip("Automatically normalize audio during playback")
-        
-        self.crossfade_check = QCheckBox()
-        self.crossfade_check.setToolTip("Enable crossfade between tracks")
-        
-        self.crossfade_spin = QDoubleSpinBox()
-        self.crossfade_spin.setRange(0.5, 5.0)
-        self.crossfade_spin.setSingleStep(0.5)
-        self.crossfade_spin.setSuffix(" seconds")
-        self.crossfade_spin.setToolTip("Duration of crossfade between tracks")
+        self.default_playlist_combo = _combo(_DEFAULT_PLAYLISTS, "Default queue to load when the player starts")
+        self.auto_normalize_check = _check("Automatically normalize audio during playback")
+        self.crossfade_check = _check("Enable crossfade between tracks")
+        self.crossfade_spin = _spin((0.5, 5.0), "Duration of crossfade between tracks",
+                                    suffix=" seconds", step=0.5, double=True)
         self.crossfade_spin.setEnabled(False)  # Disabled until checkbox checked
         
-        playback_layout.addRow("Default Playlist:", self.default_playlist_combo)
-        playback_layout.addRow("Auto-normalize:", self.auto_normalize_check)
-        playback_layout.addRow("Enable Crossfade:", self.crossfade_check)
-        playback_layout.addRow("Crossfade Duration:", self.crossfade_spin)
+        playback_group = _form_group("Playback Settings", (
+            ("Default Playlist:", self.default_playlist_combo),
+            ("Auto-normalize:", self.auto_normalize_check),
+            ("Enable Crossfade:", self.crossfade_check),
+            ("Crossfade Duration:", self.crossfade_spin),
+        ))
         
         # History Group
-        history_group = QGroupBox("Playback History")
-        history_layout = QFormLayout(history_group)
-        
-        self.keep_history_check = QCheckBox()
-        self.keep_history_check.setToolTip("Keep track of playback history")
-        
-        self.history_limit_spin = QSpinBox()
-        self.history_limit_spin.setRange(10, 1000)
-        self.history_limit_spin.setSingleStep(10)
-        self.history_limit_spin.setSuffix(" tracks")
-        self.history_limit_spin.setToolTip("Maximum number of tracks to keep in history")
+        self.keep_history_check = _check("Keep track of playback history")
+        self.history_limit_spin = _spin((10, 1000), "Maximum number of tracks to keep in history",
+                                        suffix=" tracks", step=10)
         
         clear_history_button = QPushButton("Clear History")
         clear_history_button.setToolTip("Clear all playback history")
         clear_history_button.clicked.connect(self.clear_history_clicked)
         
-        history_layout.addRow("Keep History:", self.keep_history_check)
-        history_layout.addRow("History Limit:", self.history_limit_spin)
-        history_layout.addRow("", clear_history_button)
+        history_group = _form_group("Playback History", (
+            ("Keep History:", self.keep_history_check),
+            ("History Limit:", self.history_limit_spin),
+            ("", clear_history_button),
+        ))
         
         # Connect signals
         self.crossfade_check.toggled.connect(self.crossfade_spin.setEnabled)
@@ -326,53 +432,28 @@ class SettingsPage(QWidget):
         layout = QVBoxLayout(tab)
         
         # Scoring System Group
-        scoring_group = QGroupBox("Scoring System")
-        scoring_layout = QFormLayout(scoring_group)
-        
-        self.enable_scoring_check = QCheckBox()
-        self.enable_scoring_check.setToolTip("Enable the intelligent scoring system")
+        self.enable_scoring_check = _check("Enable the intelligent scoring system")
         
-        scoring_layout.addRow("Enable Scoring:", self.enable_scoring_check)
+        scoring_group = _form_group("Scoring System", (
+            ("Enable Scoring:", self.enable_scoring_check),
+        ))
         
         # Scoring Parameters Group
-        parameters_group = QGroupBox("Scoring Parameters")
-        parameters_layout = QFormLayout(parameters_group)
-        
-        self.score_decay_spin = QDoubleSpinBox()
-        self.score_decay_spin.setRange(0.1, 1.0)
-        self.score_decay_spin.setDecimals(2)
-        self.score_decay_spin.setSingleStep(0.05)
-        self.score_decay_spin.setToolTip("How quickly scores decay over time (lower = faster decay)")
-        
-        self.new_content_boost_spin = QDoubleSpinBox()
-        self.new_content_boost_spin.setRange(1.0, 3.0)
-        self.new_content_boost_spin.setDecimals(1)
-        self.new_content_boost_spin.setSingleStep(0.1)
-        self.new_content_boost_spin.setToolTip("Boost factor for new content")
-        
-        self.time_effect_spin = QDoubleSpinBox()
-        self.time_effect_spin.setRange(0.0, 2.0)
-        self.time_effect_spin.setDecimals(1)
-        self.time_effect_spin.setSingleStep(0.1)
-        self.time_effect_spin.setToolTip("How strongly time-of-day affects scoring (0 = no effect)")
-        
-        parameters_layout.addRow("Score Decay:", self.score_decay_spin)
-        parameters_layout.addRow("New Content Boost:", self.new_content_boost_spin)
-        parameters_layout.addRow("Time Effect Strength:", self.time_effect_spin)
+        self.score_decay_spin = _spin((0.1, 1.0), "How quickly scores decay over time (lower = faster decay)",
+                                      step=0.05, decimals=2, double=True)
+        self.new_content_boost_spin = _spin((1.0, 3.0), "Boost factor for new content",
+                                            step=0.1, decimals=1, double=True)
+        self.time_effect_spin = _spin((0.0, 2.0), "How strongly time-of-day affects scoring (0 = no effect)",
+                                      step=0.1, decimals=1, double=True)
+        
+        parameters_group = _form_group("Scoring Parameters", (
+            ("Score Decay:", self.score_decay_spin),
+            ("New Content Boost:", self.new_content_boost_spin),
+            ("Time Effect Strength:", self.time_effect_spin),
+        ))
         
         # Add info box about scoring
-        info_frame = QFrame()
-        info_frame.setObjectName("info_frame")
-        info_frame.setStyleSheet("""
-            #info_frame {
-                background-color: #1a2129;
-                border-radius: 5px;
-                padding: 10px;
-            }
-        """)
-        info_layout = QVBoxLayout(info_frame)
-        
-        info_text = (
+        info_frame = _info_frame(
             "<b>Scoring System</b><br><br>"
             "The scoring system determines the optimal order for playing audio files based on several factors:<br><br>"
             "• YouTube metadata (views, comments)<br>"
@@ -385,12 +466,6 @@ class SettingsPage(QWidget):
             "• <b>Time Effect</b>: How much time-of-day influences track selection"
         )
         
-        info_label = QLabel(info_text)
-        info_label.setWordWrap(True)
-        info_label.setStyleSheet("color: #cccccc;")
-        
-        info_layout.addWidget(info_label)
-        
         # Add groups to layout
         layout.addWidget(scoring_group)
         layout.addWidget(parameters_group)
@@ -405,65 +480,47 @@ class SettingsPage(QWidget):
         layout = QVBoxLayout(tab)
         
         # Logging Group
-        logging_group = QGroupBox("Logging")
-        logging_layout = QFormLayout(logging_group)
-        
-        self.log_level_combo = QComboBox()
-        self.log_level_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
-        self.log_level_combo.setToolTip("Logging level (higher = less verbose)")
-        
-        self.console_logging_check = QCheckBox()
-        self.console_logging_check.setToolTip("Show log messages in console")
-        
-        self.log_file_check = QCheckBox()
-        self.log_file_check.setToolTip("Save log messages to file")
+        self.log_level_combo = _combo(_LOG_LEVELS, "Logging level (higher = less verbose)")
+        self.console_logging_check = _check("Show log messages in console")
+        self.log_file_check = _check("Save log messages to file")
         
         self.log_file_input = QLineEdit()
         self.log_file_input.setPlaceholderText("Path to log file")
         self.log_file_input.setReadOnly(True)
         
-        browse_log_button = QPushButton("Browse...")
-        browse_log_button.setFixedWidth(100)
-        browse_log_button.clicked.connect(self.browse_log_file)
-        
         log_file_layout = QHBoxLayout()
         log_file_layout.addWidget(self.log_file_input)
-        log_file_layout.addWidget(browse_log_button)
+        log_file_layout.addWidget(_browse_button(self.browse_log_file))
         
-        logging_layout.addRow("Log Level:", self.log_level_combo)
-        logging_layout.addRow("Console Logging:", self.console_logging_check)
-        logging_layout.addRow("File Logging:", self.log_file_check)
-        logging_layout.addRow("Log File:", log_file_layout)
+        logging_group = _form_group("Logging", (
+            ("Log Level:", self.log_level_combo),
+            ("Console Logging:", self.console_logging_check),
+            ("File Logging:", self.log_file_check),
+            ("Log File:", log_file_layout),
+        ))
         
         # Advanced Options Group
-        advanced_group = QGroupBox("Advanced Options")
-        advanced_layout = QFormLayout(advanced_group)
-        
-        self.concurrent_downloads_spin = QSpinBox()
-        self.concurrent_downloads_spin.setRange(1, 5)
-        self.concurrent_downloads_spin.setToolTip("Number of concurrent downloads (higher values may cause issues)")
+        self.concurrent_downloads_spin = _spin((1, 5), "Number of concurrent downloads (higher values may cause issues)")
         
         self.ffmpeg_path_input = QLineEdit()
         self.ffmpeg_path_input.setPlaceholderText("Path to FFmpeg executable (leave empty for default)")
         
-        browse_ffmpeg_button = QPushButton("Browse...")
-        browse_ffmpeg_button.setFixedWidth(100)
-        browse_ffmpeg_button.clicked.connect(self.browse_ffmpeg_path)
-        
         ffmpeg_layout = QHBoxLayout()
         ffmpeg_layout.addWidget(self.ffmpeg_path_input)
-        ffmpeg_layout.addWidget(browse_ffmpeg_button)
+        ffmpeg_layout.addWidget(_browse_button(self.browse_ffmpeg_path))
         
-        advanced_layout.addRow("Concurrent Downloads:", self.concurrent_downloads_spin)
-        advanced_layout.addRow("FFmpeg Path:", ffmpeg_layout)
+        advanced_group = _form_group("Advanced Options", (
+            ("Concurrent Downloads:", self.concurrent_downloads_spin),
+            ("FFmpeg Path:", ffmpeg_layout),
+        ))
         
         # Warning label
         warning_label = QLabel(
             "<b>Warning:</b> Changing these settings may affect application stability. "
             "Only modify if you know what you're doing."
         )
+        warning_label.setObjectName("warning_label")
         warning_label.setWordWrap(True)
-        warning_label.setStyleSheet("color: #cc3300;")
         
         # Add groups to layout
         layout.addWidget(logging_group)
@@ -482,104 +539,48 @@ class SettingsPage(QWidget):
         
     def load_settings(self):
         """Load settings from config."""
-        # General settings
-        self.output_dir_input.setText(self.config.get("general", "output_directory", "data/audio"))
-        self.check_interval_spin.setValue(self.config.getint("general", "check_interval", 24))
-        self.max_downloads_spin.setValue(self.config.getint("general", "max_downloads", 10))
-        
-        # UI settings
-        self.dark_theme_check.setChecked(self.config.getboolean("ui", "dark_theme", True))
-        self.startup_page_combo.setCurrentText(self.config.get("ui", "startup_page", "Audio Player"))
-        
-        # Audio settings
-        self.audio_format_combo.setCurrentText(self.config.get("audio", "format", "mp3"))
-        self.audio_bitrate_combo.setCurrentText(self.config.get("audio", "bitrate", "192k"))
-        self.normalize_audio_check.setChecked(self.config.getboolean("audio", "normalize_audio", False))
-        self.target_level_spin.setValue(self.config.getfloat("audio", "target_level", -18.0))
-        
-        # Player settings
-        self.default_playlist_combo.setCurrentText(self.config.get("player", "default_playlist", "Latest"))
-        self.auto_normalize_check.setChecked(self.config.getboolean("player", "auto_normalize", False))
-        self.crossfade_check.setChecked(self.config.getboolean("player", "crossfade", False))
-        self.crossfade_spin.setValue(self.config.getfloat("player", "crossfade_duration", 2.0))
-        self.crossfade_spin.setEnabled(self.crossfade_check.isChecked())
-        
-        self.keep_history_check.setChecked(self.config.getboolean("player", "keep_history", True))
-        self.history_limit_spin.setValue(self.config.getint("player", "history_limit", 100))
-        
-        # Scoring settings
-        self.enable_scoring_check.setChecked(self.config.getboolean("scoring", "enable_scoring", True))
-        self.score_decay_spin.setValue(self.config.getfloat("scoring", "score_decay", 0.9))
-        self.new_content_boost_spin.setValue(self.config.getfloat("scoring", "new_content_boost", 1.5))
-        self.time_effect_spin.setValue(self.config.getfloat("scoring", "time_effect_strength", 1.0))
-        
-        # Logging settings
-        self.log_level_combo.setCurrentText(self.config.get("logging", "level", "INFO"))
-        self.console_logging_check.setChecked(self.config.getboolean("logging", "console", True))
-        self.log_file_check.setChecked(self.config.getboolean("logging", "file_logging", False))
-        self.log_file_input.setText(self.config.get("logging", "file", "logs/app.log"))
-        self.log_file_input.setEnabled(self.log_file_check.isChecked())
-        
-        # Advanced settings
-        self.concurrent_downloads_spin.setValue(self.config.getint("advanced", "concurrent_downloads", 1))
-        self.ffmpeg_path_input.setText(self.config.get("advanced", "ffmpeg_path", ""))
+        # Fetch every section once and coerce values locally
+        sections = self.config.get_all()
+        
+        # Keep value-changed signals quiet while widgets are populated; checkbox
+        # toggles would otherwise cascade into setEnabled calls and repaints
+        widgets = [getattr(self, attr) for _, _, attr, kind, _ in self._SCHEMA if kind != "text"]
+        was_blocked = [widget.blockSignals(True) for widget in widgets]
+        
+        try:
+            for section, option, attr, kind, default in self._SCHEMA:
+                value = sections.get(section, {}).get(option, default)
+                parse = _KIND_PARSE.get(kind)
+                if parse is not None:
+                    try:
+                        value = parse(value)
+                    except (TypeError, ValueError):
+                        value = default
+                _KIND_LOAD[kind](getattr(self, attr), value)
+            
+            # Apply dependent widget state exactly once
+            self.crossfade_spin.setEnabled(self.crossfade_check.isChecked())
+            self.log_file_input.setEnabled(self.log_file_check.isChecked())
+        finally:
+            for widget, blocked in zip(widgets, was_blocked):
+                widget.blockSignals(blocked)
         
     def save_settings(self):
         """Save settings to config."""
-        # General settings
-        self.config.set("general", "output_directory", self.output_dir_input.text())
-        self.config.set("general", "check_interval", str(self.check_interval_spin.value()))
-        self.config.set("general", "max_downloads", str(self.max_downloads_spin.value()))
-        
-        # UI settings
-        self.config.set("ui", "dark_theme", str(self.dark_theme_check.isChecked()))
-        self.config.set("ui", "startup_page", self.startup_page_combo.currentText())
-        
-        # Audio settings
-        self.config.set("audio", "format", self.audio_format_combo.currentText())
-        self.config.set("audio", "bitrate", self.audio_bitrate_combo.currentText())
-        self.config.set("audio", "normalize_audio", str(self.normalize_audio_check.isChecked()))
-        self.config.set("audio", "target_level", str(self.target_level_spin.value()))
-        
-        # Player settings
-        self.config.set("player", "default_playlist", self.default_playlist_combo.currentText())
-        self.config.set("player", "auto_normalize", str(self.auto_normalize_check.isChecked()))
-        self.config.set("player", "crossfade", str(self.crossfade_check.isChecked()))
-        self.config.set("player", "crossfade_duration", str(self.crossfade_spin.value()))
-        
-        self.config.set("player", "keep_history", str(self.keep_history_check.isChecked()))
-        self.config.set("player", "history_limit", str(self.history_limit_spin.value()))
+        with self.config.batch() as batch:
+            for section, option, attr, kind, _ in self._SCHEMA:
+                self.config.set(section, option, _KIND_SAVE[kind](getattr(self, attr)))
         
-        # Scoring settings
-        self.config.set("scoring", "enable_scoring", str(self.enable_scoring_check.isChecked()))
-        self.config.set("scoring", "score_decay", str(self.score_decay_spin.value()))
-        self.config.set("scoring", "new_content_boost", str(self.new_content_boost_spin.value()))
-        self.config.set("scoring", "time_effect_strength", str(self.time_effect_spin.value()))
-        
-        # Logging settings
-        self.config.set("logging", "level", self.log_level_combo.currentText())
-        self.config.set("logging", "console", str(self.console_logging_check.isChecked()))
-        self.config.set("logging", "file_logging", str(self.log_file_check.isChecked()))
-        self.config.set("logging", "file", self.log_file_input.text())
-        
-        # Advanced settings
-        self.config.set("advanced", "concurrent_downloads", str(self.concurrent_downloads_spin.value()))
-        self.config.set("advanced", "ffmpeg_path", self.ffmpeg_path_input.text())
-        
-        # Save config
-        if self.config.save_config():
-            from PyQt5.QtWidgets import QMessageBox
+        if batch.saved:
             QMessageBox.information(self, "Settings Saved", "Settings have been saved successfully")
             
             # Emit signal that settings were saved
             self.settings_saved.emit()
         else:
-            from PyQt5.QtWidgets import QMessageBox
             QMessageBox.warning(self, "Error", "Failed to save settings")
         
     def reset_settings(self):
         """Reset settings to defaults."""
-        from PyQt5.QtWidgets import QMessageBox
         confirm = QMessageBox.question(
             self, 
             "Reset Settings", 
@@ -588,21 +589,41 @@ class SettingsPage(QWidget):
         )
         
         if confirm == QMessageBox.Yes:
-            # Reset config to defaults
-            self.config.reset_to_default()
+            # Show a "working" overlay and let the dialog close before the reset runs
+            if self._reset_overlay is None:
+                self._reset_overlay = QLabel("Resetting…", self.tabs)
+                self._reset_overlay.setAlignment(Qt.AlignCenter)
+                self._reset_overlay.setStyleSheet(
+                    "background-color: rgba(18, 25, 32, 180); color: white; font-size: 14px;"
+                )
+            self._reset_overlay.setGeometry(self.tabs.rect())
+            self._reset_overlay.show()
+            self._reset_overlay.raise_()
+            # Paint it now; the zero-delay timer can fire before a queued paint
+            self._reset_overlay.repaint()
+            self.reset_button.setEnabled(False)
             
-            # Reload settings
+            QTimer.singleShot(0, self._do_reset)
+        
+    def _do_reset(self):
+        """Reset config to defaults and reload the widgets."""
+        try:
+            success = self.config.reset_to_default()
             self.load_settings()
+        finally:
+            self._reset_overlay.hide()
+            self.reset_button.setEnabled(True)
             
+        if success:
             QMessageBox.information(self, "Settings Reset", "Settings have been reset to defaults")
+        else:
+            QMessageBox.warning(self, "Error", "Failed to reset settings")
         
     def browse_output_directory(self):
         """Show file browser to select output directory."""
-        from PyQt5.QtWidgets import QFileDialog
-        
         current_dir = self.output_dir_input.text()
         if not current_dir:
-            current_dir = os.path.expanduser("~")
+            current_dir = _home()
             
         directory = QFileDialog.getExistingDirectory(
             self,
@@ -615,13 +636,11 @@ class SettingsPage(QWidget):
         
     def browse_log_file(self):
         """Show file browser to select log file."""
-        from PyQt5.QtWidgets import QFileDialog
-        
         current_file = self.log_file_input.text()
         current_dir = os.path.dirname(current_file) if current_file else "logs"
         
         if not os.path.exists(current_dir):
-            current_dir = os.path.expanduser("~")
+            current_dir = _home()
             
         file_name, _ = QFileDialog.getSaveFileName(
             self,
@@ -635,10 +654,8 @@ class SettingsPage(QWidget):
         
     def browse_ffmpeg_path(self):
         """Show file browser to select FFmpeg path."""
-        from PyQt5.QtWidgets import QFileDialog
-        
         current_path = self.ffmpeg_path_input.text()
-        current_dir = os.path.dirname(current_path) if current_path else os.path.expanduser("~")
+        current_dir = os.path.dirname(current_path) if current_path else _home()
             
         file_name, _ = QFileDialog.getOpenFileName(
             self,
@@ -652,7 +669,6 @@ class SettingsPage(QWidget):
         
     def clear_history_clicked(self):
         """Handle clear history button click."""
-        from PyQt5.QtWidgets import QMessageBox
         confirm = QMessageBox.question(
             self, 
             "Clear History", 
@@ -662,23 +678,26 @@ class SettingsPage(QWidget):
         
         if confirm == QMessageBox.Yes:
             try:
-                # Clear history in scoring system
-                if hasattr(self.downloader, 'scoring') and self.downloader.scoring:
-                    if hasattr(self.downloader.scoring, 'calculator') and self.downloader.scoring.calculator:
-                        if hasattr(self.downloader.scoring.calculator, 'scores_data'):
-                            # Clear play history
-                            self.downloader.scoring.calculator.scores_data["play_history"] = []
-                            
-                            # Reset play counts
-                            for video_id in self.downloader.scoring.calculator.scores_data["videos"]:
-                                self.downloader.scoring.calculator.scores_data["videos"][video_id]["play_count"] = 0
-                                self.downloader.scoring.calculator.scores_data["videos"][video_id]["last_played"] = None
-                            
-                            # Save changes
-                            self.downloader.scoring.calculator._save_scores()
-                            
+                # Clear history in scoring system, if one is attached
+                try:
+                    calculator = self.downloader.scoring.calculator
+                    scores_data = calculator.scores_data
+                except AttributeError:
+                    calculator = None
+                    
+                if calculator is not None:
+                    # Clear play history
+                    scores_data["play_history"] = []
+                    
+                    # Reset play counts
+                    for video in scores_data["videos"].values():
+                        video["play_count"] = 0
+                        video["last_played"] = None
+                    
+                    # Save changes
+                    calculator._save_scores()
+                    
                 QMessageBox.information(self, "History Cleared", "Playback history has been cleared")
             except Exception as e:
-                import logging
                 logging.error(f"Error clearing history: {str(e)}")
                 QMessageBox.warning(self, "Error", f"Failed to clear history: {str(e)}")
\ No newline at end of file
@@ -1,8 +1,50 @@
 """Icon provider for the application."""
 import os
+from typing import Dict, Optional
 from PyQt5.QtGui import QIcon, QPixmap
 from PyQt5.QtCore import QSize, Qt
 
+# gui/icons, resolved independently of the working directory
+ICONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "icons")
+
 class IconProvider:
     """Utility for loading and managing icons."""
-    # Implementation
+
+    # Shared QIcon handles keyed by file name (None for missing files)
+    _cache: Dict[str, Optional[QIcon]] = {}
+    
+    # Paths of the files in the icons directory, keyed by file name
+    _files: Optional[Dict[str, str]] = None
+
+    @classmethod
+    def _icon_files(cls) -> Dict[str, str]:
+        """List the icons directory once instead of checking each icon path."""
+        if cls._files is None:
+            try:
+                with os.scandir(ICONS_DIR) as it:
+                    cls._files = {entry.name: entry.path for entry in it if entry.is_file()}
+            except OSError:
+                cls._files = {}
+        return cls._files
+
+    @classmethod
+    def get(cls, name: str) -> Optional[QIcon]:
+        """
+        Get a shared icon from the icons directory.
+
+        The file is looked up and decoded once; later calls return the same
+        QIcon, which Qt shares implicitly between widgets.
+
+        Args:
+            name: Icon file name, e.g. "refresh.svg"
+
+        Returns:
+            The icon, or None if the file does not exist
+        """
+        try:
+            return cls._cache[name]
+        except KeyError:
+            path = cls._icon_files().get(name)
+            icon = QIcon(path) if path else None
+            cls._cache[name] = icon
+            return icon
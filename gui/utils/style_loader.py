@@ -1,6 +1,30 @@
 """Style sheet loader for the application."""
-import os
+import logging
+from typing import Optional
+
+from PyQt5.QtWidgets import QApplication
 
 class StyleLoader:
     """Utility for loading and applying styles."""
-    # Implementation
+
+    # The dark style sheet, read from qdarkstyle's resources once
+    _dark_sheet: Optional[str] = None
+
+    @classmethod
+    def dark_stylesheet(cls) -> str:
+        """Get the qdarkstyle style sheet, loading it on first use."""
+        if cls._dark_sheet is None:
+            import qdarkstyle
+            cls._dark_sheet = qdarkstyle.load_stylesheet_pyqt5()
+        return cls._dark_sheet
+
+    @classmethod
+    def apply_theme(cls, app: QApplication) -> None:
+        """
+        Apply the dark theme to the whole application.
+
+        Args:
+            app: Application to style
+        """
+        app.setStyleSheet(cls.dark_stylesheet())
+        logging.debug("Applied dark theme")
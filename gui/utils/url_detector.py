@@ -2,15 +2,135 @@
 URL detection utility to identify YouTube URLs.
 """
 import re
-import logging
+import sys
+import string
+import functools
 
+# All recognised URL shapes in one alternation, tried in order: videos,
+# then playlists, then channels. The name of the ID group that matched
+# tells us which kind of URL it is. The pattern is ASCII-only, so re.ASCII
+# skips the Unicode tables.
+_URL_RE = re.compile(
+    r'(?:https?:\/\/)?(?:www\.)?(?:'
+    # Standard watch URLs
+    r'youtube\.com\/watch\?v=(?P<video>[a-zA-Z0-9_-]{11})(?:&.*)?$'
+    # Short youtu.be URLs
+    r'|youtu\.be\/(?P<short_video>[a-zA-Z0-9_-]{11})(?:\?.*)?$'
+    # Standard playlist URLs
+    r'|youtube\.com\/playlist\?list=(?P<playlist>[a-zA-Z0-9_-]+)(?:&.*)?$'
+    # Watch URL with playlist parameter; the last "list=" (including the
+    # end of "playlist=") wins
+    r'|youtube\.com\/watch\?.*list=(?P<watch_playlist>[a-zA-Z0-9_-]+)(?:&.*)?$'
+    # Channel URLs
+    r'|youtube\.com\/channel\/(?P<channel>[a-zA-Z0-9_-]+)(?:\/.*)?$'
+    # User URLs
+    r'|youtube\.com\/user\/(?P<user>[a-zA-Z0-9_-]+)(?:\/.*)?$'
+    r')',
+    re.ASCII
+)
+
+# A "t" parameter given as plain seconds or as 1m30s
+_START_TIME_RE = re.compile(r'[?&]t=(\d+|\d+m\d+s)(?:&|$)')
+
+# URL types, interned so callers can compare them by identity
+_VIDEO = sys.intern("video")
+_PLAYLIST = sys.intern("playlist")
+_CHANNEL = sys.intern("channel")
+
+# Shared result for anything that is not a recognised YouTube URL
+_UNKNOWN = (sys.intern("unknown"), None, None)
+
+_GROUP_TYPES = {
+    "video": _VIDEO,
+    "short_video": _VIDEO,
+    "playlist": _PLAYLIST,
+    "watch_playlist": _PLAYLIST,
+    "channel": _CHANNEL,
+    "user": _CHANNEL,
+}
+
+# Every URL the pattern above can accept starts with one of these
+_URL_PREFIXES = ('http://', 'https://', 'www.youtu', 'youtube.com', 'youtu.be')
+
+# Characters allowed in a video ID, as a 256-entry byte lookup table
+# (1 = allowed) so a whole candidate is classified by one translate() call
+_VALID_ID_CHARS = frozenset(string.ascii_letters + string.digits + '_-')
+_ID_TABLE = bytes(1 if chr(i) in _VALID_ID_CHARS else 0 for i in range(256))
+_ID_OK = b'\x01' * 11
+
+def _is_video_id(candidate: str) -> bool:
+    """Check that candidate is exactly 11 valid video-ID characters."""
+    data = candidate.encode('ascii', 'ignore')
+    return len(data) == 11 and data.translate(_ID_TABLE) == _ID_OK
+
+def _extract_video_id(url: str):
+    """
+    Slice the video ID out of a plain watch or youtu.be URL without regex.
+
+    Args:
+        url: Stripped URL
+
+    Returns:
+        The 11-character video ID, or None if the URL is not one of the two
+        common video shapes (the caller then falls back to the full pattern)
+    """
+    rest = url
+    if rest.startswith('https://'):
+        rest = rest[8:]
+    elif rest.startswith('http://'):
+        rest = rest[7:]
+    if rest.startswith('www.'):
+        rest = rest[4:]
+
+    if rest.startswith('youtube.com/watch?v='):
+        candidate, tail = rest[20:31], rest[31:32]
+        if tail not in ('', '&'):
+            return None
+    elif rest.startswith('youtu.be/'):
+        candidate, tail = rest[9:20], rest[20:21]
+        if tail not in ('', '?'):
+            return None
+    else:
+        return None
+
+    # The patterns' ".*" tails stop at a line break; leave those to the regex
+    if tail and '\n' in rest:
+        return None
+
+    return candidate if _is_video_id(candidate) else None
+
+def _parse_start_time(url: str):
+    """
+    Find the start time given by a URL's ``t`` parameter.
+
+    Args:
+        url: Stripped URL
+
+    Returns:
+        Start time in seconds ("90" or "1m30s"), or None if there is none
+    """
+    match = _START_TIME_RE.search(url)
+    if not match:
+        return None
+
+    time_str = match.group(1)
+    if time_str.endswith('s'):
+        # Format: 1m30s
+        minutes, seconds = time_str[:-1].split('m')
+        return int(minutes) * 60 + int(seconds)
+    # Format: seconds
+    return int(time_str)
+
+@functools.lru_cache(maxsize=4096)
 def identify_youtube_url(url: str) -> tuple:
     """
     Identify the type of YouTube URL and extract relevant information.
-    
+
+    Results are memoized; use ``identify_youtube_url.cache_clear()`` to reset.
+
     Args:
         url: The URL to identify
-        
+
     Returns:
         tuple: (url_type, id, start_time)
             url_type can be "video", "playlist", "channel", or "unknown"
@@ -18,68 +138,28 @@ def identify_youtube_url(url: str) -> tuple:
             start_time is the start time in seconds (if present in the URL)
     """
     if not url:
-        return "unknown", None, None
-        
-    url = url.strip()
-    
-    # Video URL patterns
-    video_patterns = [
-        # Standard watch URLs
-        r'(?:https?:\/\/)?(?:www\.)?youtube\.com\/watch\?v=([a-zA-Z0-9_-]{11})(?:&.*)?$',
-        # Short youtu.be URLs
-        r'(?:https?:\/\/)?(?:www\.)?youtu\.be\/([a-zA-Z0-9_-]{11})(?:\?.*)?$'
-    ]
-    
-    # Playlist URL patterns
-    playlist_patterns = [
-        # Standard playlist URLs
-        r'(?:https?:\/\/)?(?:www\.)?youtube\.com\/playlist\?list=([a-zA-Z0-9_-]+)(?:&.*)?$',
-        # Watch URL with playlist parameter
-        r'(?:https?:\/\/)?(?:www\.)?youtube\.com\/watch\?.*list=([a-zA-Z0-9_-]+)(?:&.*)?$'
-    ]
-    
-    # Channel URL patterns
-    channel_patterns = [
-        # Channel URLs
-        r'(?:https?:\/\/)?(?:www\.)?youtube\.com\/channel\/([a-zA-Z0-9_-]+)(?:\/.*)?$',
-        # User URLs
-        r'(?:https?:\/\/)?(?:www\.)?youtube\.com\/user\/([a-zA-Z0-9_-]+)(?:\/.*)?$'
-    ]
-    
-    # Check for video URLs
-    for pattern in video_patterns:
-        match = re.match(pattern, url)
-        if match:
-            video_id = match.group(1)
-            
-            # Check for start time parameter
-            start_time = None
-            start_time_match = re.search(r'[?&]t=(\d+|(?:\d+m\d+s))(?:&|$)', url)
-            if start_time_match:
-                time_str = start_time_match.group(1)
-                if 'm' in time_str and 's' in time_str:
-                    # Format: 1m30s
-                    minutes, seconds = time_str.split('m')
-                    seconds = seconds.rstrip('s')
-                    start_time = int(minutes) * 60 + int(seconds)
-                else:
-                    # Format: seconds
-                    start_time = int(time_str)
-            
-            return "video", video_id, start_time
-    
-    # Check for playlist URLs
-    for pattern in playlist_patterns:
-        match = re.match(pattern, url)
-        if match:
-            playlist_id = match.group(1)
-            return "playlist", playlist_id, None
-    
-    # Check for channel URLs
-    for pattern in channel_patterns:
-        match = re.match(pattern, url)
-        if match:
-            channel_id = match.group(1)
-            return "channel", channel_id, None
-    
-    return "unknown", None, None
\ No newline at end of file
+        return _UNKNOWN
+
+    # Only allocate a stripped copy when there is whitespace to remove
+    if url[0].isspace() or url[-1].isspace():
+        url = url.strip()
+
+    # Cheap literal check so non-YouTube strings never reach the regex engine
+    if not url.startswith(_URL_PREFIXES):
+        return _UNKNOWN
+
+    # Fast path for the two common video shapes, full pattern otherwise
+    video_id = _extract_video_id(url)
+    if video_id is None:
+        match = _URL_RE.match(url)
+        if not match:
+            return _UNKNOWN
+
+        group = match.lastgroup
+        url_type = _GROUP_TYPES[group]
+        if url_type is not _VIDEO:
+            return url_type, match.group(group), None
+        video_id = match.group(group)
+
+    # Check for start time parameter
+    return _VIDEO, video_id, _parse_start_time(url)
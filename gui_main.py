@@ -8,7 +8,6 @@ import logging
 import argparse
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtGui import QIcon
-import qdarkstyle
 
 # Import custom modules
 from utils.logger import setup_logging
@@ -18,6 +17,7 @@ from downloader.tracker import DownloadTracker
 from downloader.scoring import ScoringSystem
 from audio.player import AudioPlayer
 from gui.main_window import YouTubePlaylistDownloaderApp
+from gui.utils.style_loader import StyleLoader
 
 def setup_data_directories():
     """Create necessary data directories."""
@@ -67,7 +67,7 @@ def main():
     # Create application
     app = QApplication(sys.argv)
     app.setApplicationName("YouTube Playlist Downloader")
-    app.setStyleSheet(qdarkstyle.load_stylesheet_pyqt5())
+    StyleLoader.apply_theme(app)
     
     # Set application icon if available
     icon_path = os.path.join("gui", "icons", "logo.svg")
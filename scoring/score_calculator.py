@@ -4,6 +4,7 @@ Score calculator for determining audio playback order.
 import os
 import json
 import math
+import heapq
 import logging
 import random
 from datetime import datetime
@@ -223,11 +224,9 @@ class ScoreCalculator:
                     
                     scored_videos.append(video_copy)
         
-        # Sort by score (descending)
-        scored_videos.sort(key=lambda x: x.get("score", 0), reverse=True)
-        
-        # Limit results
-        return scored_videos[:limit]
+        # Select the highest scores (descending) without sorting every video;
+        # same order as a stable descending sort cut to the limit
+        return heapq.nlargest(limit, scored_videos, key=lambda x: x.get("score", 0))
     
     def record_play(self, video_id: str, duration_played: int = None):
         """
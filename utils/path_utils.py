@@ -3,31 +3,46 @@ Path utilities for consistent file system access.
 """
 import os
 import sys
+import functools
 from typing import List, Optional
 
 
+# Maps both separator styles to os.sep in a single translate() pass
+_SEP_TABLE = str.maketrans({'/': os.sep, '\\': os.sep})
+
+# The audio folder prefix, as it appears after separator normalization
+_DATA_AUDIO = f"data{os.sep}audio"
+
 def clean_output_path(path: str) -> str:
     """
     Clean a file or directory path to prevent duplication issues.
     """
     # Normalize path separators to OS-specific format
-    import os
-    normalized_path = path.replace('/', os.sep).replace('\\', os.sep)
+    normalized_path = path.translate(_SEP_TABLE)
     
-    # Check for data/audio duplication
-    data_audio_pattern = f"data{os.sep}audio"
-    
-    if normalized_path.count(data_audio_pattern) > 1:
-        # Split path by the pattern
-        parts = normalized_path.split(data_audio_pattern)
-        
-        # Keep only the first occurrence and the last part
-        if len(parts) >= 2:
-            cleaned_path = data_audio_pattern + parts[-1]
-            return cleaned_path
+    # Check for data/audio duplication: keep only the last occurrence and
+    # what follows it, slicing once instead of counting and splitting
+    last = normalized_path.rfind(_DATA_AUDIO)
+    if last > 0 and normalized_path.find(_DATA_AUDIO) != last:
+        return normalized_path[last:]
     
     return normalized_path
 
+@functools.lru_cache(maxsize=None)
+def _app_root() -> str:
+    """
+    Get the application root directory.
+    
+    The location cannot change while the process runs, so it is resolved once.
+    """
+    if getattr(sys, 'frozen', False):
+        # If running as compiled executable (PyInstaller)
+        return os.path.dirname(sys.executable)
+    # If running as script, go up to the application root
+    # Adjust the number of parent directories as needed based on where this module is located
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.dirname(current_dir)  # Go up one level
+
 def get_path(*args: str) -> str:
     """
     Get an absolute path relative to the application root directory.
@@ -41,18 +56,8 @@ def get_path(*args: str) -> str:
     Example:
         get_path("data", "download_history.json") -> "/path/to/app/data/download_history.json"
     """
-    # Determine the application root directory
-    if getattr(sys, 'frozen', False):
-        # If running as compiled executable (PyInstaller)
-        app_root = os.path.dirname(sys.executable)
-    else:
-        # If running as script, go up to the application root
-        # Adjust the number of parent directories as needed based on where this module is located
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        app_root = os.path.dirname(current_dir)  # Go up one level
-    
     # Join the app root with the provided path components
-    return os.path.join(app_root, *args)
+    return os.path.join(_app_root(), *args)
 
 def ensure_dir_exists(path: str) -> bool:
     """
@@ -73,6 +78,14 @@ def ensure_dir_exists(path: str) -> bool:
         logging.error(f"Error creating directory {path}: {str(e)}")
         return False
 
+# Directories already confirmed by _ensure_dir_once
+_ensured_dirs = set()
+
+def _ensure_dir_once(path: str) -> None:
+    """Ensure a directory exists, checking each path only once per process."""
+    if path not in _ensured_dirs and ensure_dir_exists(path):
+        _ensured_dirs.add(path)
+
 def get_data_path(filename: Optional[str] = None) -> str:
     """
     Get the path to a file in the data directory.
@@ -85,7 +98,7 @@ def get_data_path(filename: Optional[str] = None) -> str:
         Absolute path to the data directory or file
     """
     data_dir = get_path("data")
-    ensure_dir_exists(data_dir)
+    _ensure_dir_once(data_dir)
     
     if filename:
         return os.path.join(data_dir, filename)
@@ -103,7 +116,7 @@ def get_audio_path(filename: Optional[str] = None) -> str:
         Absolute path to the audio directory or file
     """
     audio_dir = get_path("data", "audio")
-    ensure_dir_exists(audio_dir)
+    _ensure_dir_once(audio_dir)
     
     if filename:
         return os.path.join(audio_dir, filename)
@@ -121,7 +134,7 @@ def get_logs_path(filename: Optional[str] = None) -> str:
         Absolute path to the logs directory or file
     """
     logs_dir = get_path("logs")
-    ensure_dir_exists(logs_dir)
+    _ensure_dir_once(logs_dir)
     
     if filename:
         return os.path.join(logs_dir, filename)
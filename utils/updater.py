@@ -7,14 +7,10 @@ import sys
 import logging
 import tempfile
 import shutil
-import subprocess
 import json
 import time
 from typing import Dict, Optional, Tuple, List
-import urllib.request
-import zipfile
 import re
-from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +50,10 @@ class Updater:
             Tuple of (update_available, latest_version, release_notes)
         """
         try:
+            # Loaded here rather than at import: urllib.request pulls in ssl,
+            # http.client and email, which nothing else at startup needs
+            import urllib.request
+            
             # Get latest release info from GitHub API
             logger.info(f"Checking for updates from {self.api_url}/releases/latest")
             
@@ -147,6 +147,7 @@ class Updater:
             zip_path = os.path.join(temp_dir, f"{self.repo_name}.zip")
             
             # Download the zip file
+            import urllib.request
             urllib.request.urlretrieve(download_url, zip_path, self._download_progress)
             
             logger.info(f"Update downloaded to {zip_path}")
@@ -251,6 +252,7 @@ class Updater:
             logger.info(f"Extracting update to {extract_dir}")
             
             # Extract the zip file
+            import zipfile
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
                 zip_ref.extractall(extract_dir)
             
@@ -439,16 +441,23 @@ class Updater:
             ".env"
         ]
         
+        # Names already in the destination, listed once rather than checked
+        # file by file
+        existing = set(os.listdir(dst_dir))
+        
         # Copy all files and directories from source to destination
-        for item in os.listdir(src_dir):
+        with os.scandir(src_dir) as entries:
+            src_entries = list(entries)
+        for entry in src_entries:
+            item = entry.name
             # Skip excluded items
             if item in excluded_items:
                 continue
                 
-            src_item = os.path.join(src_dir, item)
+            src_item = entry.path
             dst_item = os.path.join(dst_dir, item)
             
-            if os.path.isdir(src_item):
+            if entry.is_dir():
                 # For directories, we need to handle recursively
                 self._copy_directory_with_preservation(src_item, dst_item, dst_dir)
                 logger.info(f"Copied directory: {item}")
@@ -456,7 +465,7 @@ class Updater:
                 # For files, check if it's a preserved file
                 if not self._is_path_preserved(dst_item, dst_dir):
                     # Remove existing file if it exists
-                    if os.path.exists(dst_item):
+                    if item in existing:
                         os.remove(dst_item)
                     
                     # Copy the file
@@ -478,19 +487,25 @@ class Updater:
         if not os.path.exists(dst_dir):
             os.makedirs(dst_dir)
         
+        # Names already in the destination, listed once per directory
+        existing = set(os.listdir(dst_dir))
+        
         # Copy all files and subdirectories
-        for item in os.listdir(src_dir):
-            src_item = os.path.join(src_dir, item)
+        with os.scandir(src_dir) as entries:
+            src_entries = list(entries)
+        for entry in src_entries:
+            item = entry.name
+            src_item = entry.path
             dst_item = os.path.join(dst_dir, item)
             
-            if os.path.isdir(src_item):
+            if entry.is_dir():
                 # Recursively copy subdirectories
                 self._copy_directory_with_preservation(src_item, dst_item, app_dir)
             else:
                 # Only copy if it's not a preserved file
                 if not self._is_path_preserved(dst_item, app_dir):
                     # Remove existing file if it exists
-                    if os.path.exists(dst_item):
+                    if item in existing:
                         os.remove(dst_item)
                     
                     # Copy the file
@@ -553,6 +568,7 @@ class Updater:
                 os.execv(sys.executable, [sys.executable] + sys.argv)
             else:
                 # Running as script
+                import subprocess
                 args = [sys.executable] + sys.argv
                 subprocess.Popen(args)
                 sys.exit(0)